@@ -104,6 +104,107 @@ char* pg_encrypt_pii(const char *plaintext, const char *pii_type) {
     return token;
 }
 
+// Encrypt directly into a caller-provided buffer.
+// Avoids the malloc + copy-out that the pointer-returning API pays per
+// call; all scratch space lives on the stack.
+// Returns 0 on success, -1 on failure or if out_cap is too small.
+int pg_encrypt_into(const char *plaintext, const char *pii_type,
+                    char *out, size_t out_cap, size_t *out_len) {
+    if (!initialized || !plaintext || !out) return -1;
+
+    size_t pt_len = strlen(plaintext);
+    size_t type_len = pii_type ? strlen(pii_type) : 0;
+    size_t payload_len = type_len + 1 + pt_len;
+    if (payload_len > MAX_PII_LENGTH) return -1;
+
+    // Create payload: type|plaintext
+    unsigned char payload[MAX_PII_LENGTH];
+    if (pii_type) {
+        memcpy(payload, pii_type, type_len);
+    }
+    payload[type_len] = '|';
+    memcpy(payload + type_len + 1, plaintext, pt_len);
+
+    // nonce + ciphertext + tag
+    unsigned char ciphertext[NONCE_SIZE + MAX_PII_LENGTH + TAG_SIZE];
+    randombytes_buf(ciphertext, NONCE_SIZE);
+
+    unsigned long long actual_ct_len;
+    crypto_aead_xchacha20poly1305_ietf_encrypt(
+        ciphertext + NONCE_SIZE, &actual_ct_len,
+        payload, payload_len,
+        NULL, 0,
+        NULL,
+        ciphertext,
+        master_key
+    );
+
+    size_t prefix_len = strlen(TOKEN_PREFIX);
+    size_t suffix_len = strlen(TOKEN_SUFFIX);
+    size_t b64_len = sodium_base64_ENCODED_LEN(NONCE_SIZE + actual_ct_len,
+                                                sodium_base64_VARIANT_URLSAFE_NO_PADDING);
+    if (out_cap < prefix_len + b64_len + suffix_len + 1) return -1;
+
+    memcpy(out, TOKEN_PREFIX, prefix_len);
+    sodium_bin2base64(out + prefix_len, b64_len,
+                      ciphertext, NONCE_SIZE + actual_ct_len,
+                      sodium_base64_VARIANT_URLSAFE_NO_PADDING);
+    size_t total = prefix_len + strlen(out + prefix_len);
+    memcpy(out + total, TOKEN_SUFFIX, suffix_len);
+    total += suffix_len;
+    out[total] = '\0';
+
+    if (out_len) *out_len = total;
+    return 0;
+}
+
+// Decrypt directly into a caller-provided buffer.
+// Returns 0 on success, -1 on failure or if out_cap is too small.
+int pg_decrypt_into(const char *token, char *out, size_t out_cap, size_t *out_len) {
+    if (!initialized || !token || !out) return -1;
+
+    const char *start = token;
+    if (strncmp(token, TOKEN_PREFIX, strlen(TOKEN_PREFIX)) == 0) {
+        start = token + strlen(TOKEN_PREFIX);
+    }
+
+    size_t token_len = strlen(start);
+    if (token_len > strlen(TOKEN_SUFFIX) &&
+        strcmp(start + token_len - strlen(TOKEN_SUFFIX), TOKEN_SUFFIX) == 0) {
+        token_len -= strlen(TOKEN_SUFFIX);
+    }
+
+    unsigned char ciphertext[NONCE_SIZE + MAX_PII_LENGTH + TAG_SIZE];
+    if (token_len > sizeof(ciphertext) * 4 / 3 + 4) return -1;
+
+    size_t bin_len;
+    if (sodium_base642bin(ciphertext, sizeof(ciphertext), start, token_len,
+                          NULL, &bin_len, NULL,
+                          sodium_base64_VARIANT_URLSAFE_NO_PADDING) != 0) {
+        return -1;
+    }
+
+    if (bin_len < NONCE_SIZE + TAG_SIZE) return -1;
+
+    size_t pt_maxlen = bin_len - NONCE_SIZE - TAG_SIZE;
+    if (out_cap < pt_maxlen + 1) return -1;
+
+    unsigned long long pt_len;
+    if (crypto_aead_xchacha20poly1305_ietf_decrypt(
+            (unsigned char*)out, &pt_len,
+            NULL,
+            ciphertext + NONCE_SIZE, bin_len - NONCE_SIZE,
+            NULL, 0,
+            ciphertext,
+            master_key) != 0) {
+        return -1;
+    }
+
+    out[pt_len] = '\0';
+    if (out_len) *out_len = pt_len;
+    return 0;
+}
+
 // Decrypt a token back to plaintext
 // Returns: decrypted value with type prefix, caller must free()
 char* pg_decrypt_token(const char *token) {
@@ -179,11 +280,35 @@ char* privacy_guardian_decrypt(const char *token) {
     return pg_decrypt_token(token);
 }
 
+__attribute__((visibility("default")))
+int privacy_guardian_encrypt_into(const char *plaintext, const char *pii_type,
+                                  char *out, size_t out_cap, size_t *out_len) {
+    return pg_encrypt_into(plaintext, pii_type, out, out_cap, out_len);
+}
+
+__attribute__((visibility("default")))
+int privacy_guardian_decrypt_into(const char *token, char *out,
+                                  size_t out_cap, size_t *out_len) {
+    return pg_decrypt_into(token, out, out_cap, out_len);
+}
+
 __attribute__((visibility("default")))
 void privacy_guardian_free(char *ptr) {
     free(ptr);
 }
 
+// Expose libsodium's runtime CPU feature detection so callers can
+// verify which ChaCha20 implementation will be dispatched
+__attribute__((visibility("default")))
+int privacy_guardian_has_avx2(void) {
+    return sodium_runtime_has_avx2();
+}
+
+__attribute__((visibility("default")))
+int privacy_guardian_has_ssse3(void) {
+    return sodium_runtime_has_ssse3();
+}
+
 // Test main
 #ifdef PG_TEST_MAIN
 int main() {
@@ -4,11 +4,17 @@ Uses XChaCha20-Poly1305 via libsodium for fast, secure encryption.
 """
 
 import ctypes
-from ctypes import c_char_p, c_int, c_void_p
+import threading
+from ctypes import byref, c_char_p, c_int, c_size_t, c_void_p, POINTER
 from pathlib import Path
 import os
 
 
+# Output buffer size for the in-place API: large enough for the base64
+# token of a MAX_PII_LENGTH payload plus prefix/suffix
+_BUF_SIZE = 8192
+
+
 class CryptoNative:
     """Python wrapper for the C crypto library (libpgcrypto.so)"""
 
@@ -36,7 +42,9 @@ class CryptoNative:
                     "libpgcrypto.so not found. Run 'make' to build it."
                 )
 
-        # Load the library
+        # Load the library. CDLL (as opposed to PyDLL) releases the GIL
+        # for the duration of each foreign call, so concurrent threads
+        # run libsodium encrypt/decrypt in parallel on multi-core CPUs.
         self._lib = ctypes.CDLL(lib_path)
 
         # Define function signatures - use c_void_p for returned pointers
@@ -52,6 +60,24 @@ class CryptoNative:
         self._lib.privacy_guardian_free.argtypes = [c_void_p]
         self._lib.privacy_guardian_free.restype = None
 
+        # Newer builds expose an in-place API that writes into a caller
+        # buffer, skipping the malloc + string_at copy per call
+        try:
+            self._lib.privacy_guardian_encrypt_into.argtypes = [
+                c_char_p, c_char_p, c_char_p, c_size_t, POINTER(c_size_t)
+            ]
+            self._lib.privacy_guardian_encrypt_into.restype = c_int
+            self._lib.privacy_guardian_decrypt_into.argtypes = [
+                c_char_p, c_char_p, c_size_t, POINTER(c_size_t)
+            ]
+            self._lib.privacy_guardian_decrypt_into.restype = c_int
+            self._has_into_api = True
+        except AttributeError:
+            self._has_into_api = False
+
+        # Reusable per-thread output buffer for the in-place API
+        self._local = threading.local()
+
         # Initialize with key path
         if key_path is None:
             key_dir = Path.home() / ".privacyguardian"
@@ -65,6 +91,26 @@ class CryptoNative:
 
         self._initialized = True
 
+    def runtime_features(self) -> dict:
+        """Report which SIMD paths libsodium dispatches on this CPU"""
+        features = {}
+        for name, symbol in (("avx2", "privacy_guardian_has_avx2"),
+                             ("ssse3", "privacy_guardian_has_ssse3")):
+            try:
+                func = getattr(self._lib, symbol)
+                func.restype = c_int
+                features[name] = bool(func())
+            except AttributeError:
+                features[name] = None  # library predates the probe
+        return features
+
+    def _out_buf(self):
+        """Get this thread's reusable output buffer, creating it on first use"""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = ctypes.create_string_buffer(_BUF_SIZE)
+        return buf
+
     def encrypt(self, plaintext: str, pii_type: str = None) -> str:
         """
         Encrypt a PII value and return a token.
@@ -81,6 +127,18 @@ class CryptoNative:
 
         pii_type_bytes = pii_type.encode('utf-8') if pii_type else None
 
+        if self._has_into_api:
+            buf = self._out_buf()
+            out_len = c_size_t(0)
+            result = self._lib.privacy_guardian_encrypt_into(
+                plaintext.encode('utf-8'), pii_type_bytes,
+                buf, _BUF_SIZE, byref(out_len)
+            )
+            if result == 0:
+                return buf.raw[:out_len.value].decode('utf-8')
+            # The in-place API rejects payloads over its fixed buffer
+            # cap; fall through to the malloc'ing legacy path for those
+
         result_ptr = self._lib.privacy_guardian_encrypt(
             plaintext.encode('utf-8'),
             pii_type_bytes
@@ -108,6 +166,18 @@ class CryptoNative:
         if not self._initialized:
             raise RuntimeError("Crypto library not initialized")
 
+        if self._has_into_api:
+            buf = self._out_buf()
+            out_len = c_size_t(0)
+            result = self._lib.privacy_guardian_decrypt_into(
+                token.encode('utf-8'), buf, _BUF_SIZE, byref(out_len)
+            )
+            if result == 0:
+                return buf.raw[:out_len.value].decode('utf-8')
+            # Nonzero covers both invalid tokens and plaintexts larger
+            # than the fixed buffer (legacy vault entries); let the
+            # legacy path decide which it was
+
         result_ptr = self._lib.privacy_guardian_decrypt(token.encode('utf-8'))
 
         if not result_ptr:
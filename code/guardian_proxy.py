@@ -7,10 +7,13 @@ and decrypts tokens in responses so you see the original data locally.
 Supports: Anthropic, OpenAI, Google, Azure, Mistral, Cohere, Groq, and more.
 """
 
-import json
+import asyncio
 import os
+import re
 import sqlite3
 import hashlib
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime
@@ -18,7 +21,14 @@ from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
 import httpx
-from crypto_native import CryptoNative
+import orjson
+
+# Optional: pyahocorasick for single-pass token substitution
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+from crypto_native import CryptoNative, get_crypto
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import StreamingResponse
 import uvicorn
@@ -36,24 +46,55 @@ from request_parser import RequestParser, StreamingParser
 # ============================================================================
 
 class EventBus:
-    """Simple event bus for real-time updates to GUI/notifications"""
+    """Simple event bus for real-time updates to GUI/notifications.
+
+    When subscribed from a running event loop, each listener gets a
+    bounded queue drained by a background task, so emit() on the
+    request path never waits on a slow handler. Without a loop
+    (tests, sync callers) handlers are invoked inline as before.
+    """
 
     def __init__(self):
-        self.listeners: Dict[str, List[Callable]] = {}
+        self.listeners: Dict[str, List[dict]] = {}
+        self.dropped = 0
 
     def subscribe(self, event: str, callback: Callable):
+        entry = {"callback": callback, "queue": None}
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            entry["queue"] = asyncio.Queue(maxsize=1024)
+            # The loop only holds weak refs to tasks; keep a strong one
+            # on the entry so the drain task can't be GC'd mid-flight
+            entry["task"] = loop.create_task(self._drain(entry["queue"], callback))
         if event not in self.listeners:
             self.listeners[event] = []
-        self.listeners[event].append(callback)
+        self.listeners[event].append(entry)
 
     def emit(self, event: str, data: Any = None):
-        if event in self.listeners:
-            for callback in self.listeners[event]:
+        for entry in self.listeners.get(event, []):
+            queue = entry["queue"]
+            if queue is not None:
+                try:
+                    queue.put_nowait(data)
+                except asyncio.QueueFull:
+                    self.dropped += 1
+            else:
                 try:
-                    callback(data)
+                    entry["callback"](data)
                 except Exception as e:
                     print(f"Event handler error: {e}")
 
+    async def _drain(self, queue: "asyncio.Queue", callback: Callable):
+        while True:
+            data = await queue.get()
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"Event handler error: {e}")
+
 
 # Global event bus
 events = EventBus()
@@ -74,15 +115,61 @@ class TokenVault:
         self.db_file = self.vault_dir / "vault.db"
         self.key_file = self.vault_dir / "pg_master.key"
 
+        self._db_local = threading.local()
+
         self._init_crypto()
         self._init_db()
 
+        # Token ids already in the vault - membership check without a
+        # SQLite round-trip per PII match
+        self._known_ids = {
+            row[0] for row in self.conn.execute("SELECT token_id FROM tokens")
+        }
+
+        # Stats counters, seeded once from the database and maintained
+        # incrementally so stats() never rescans the tables
+        count, uses = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(use_count), 0) FROM tokens"
+        ).fetchone()
+        self._total_tokens = count
+        self._total_uses = uses
+        self._by_type = Counter(dict(self.conn.execute(
+            "SELECT pii_type, COUNT(*) FROM tokens GROUP BY pii_type"
+        )))
+        self._by_provider = Counter(dict(self.conn.execute(
+            "SELECT provider, COUNT(*) FROM activity_log WHERE provider IS NOT NULL GROUP BY provider"
+        )))
+
     def _init_crypto(self):
         """Initialize the C crypto library (XChaCha20-Poly1305 via libsodium)"""
-        self.crypto = CryptoNative(key_path=str(self.key_file))
+        default_key = Path.home() / ".privacyguardian" / "pg_master.key"
+        if self.key_file == default_key:
+            # Share the process-wide instance so libpgcrypto.so is loaded
+            # and initialized only once per process.
+            self.crypto = get_crypto()
+        else:
+            self.crypto = CryptoNative(key_path=str(self.key_file))
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection, created lazily.
+
+        One shared connection serializes every query behind a single
+        mutex; with WAL, per-thread connections let readers run
+        concurrently with a writer.
+        """
+        conn = getattr(self._db_local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_file))
+            # WAL avoids a full fsync per commit and lets readers run
+            # while a write is in flight; NORMAL syncs only at checkpoints
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._db_local.conn = conn
+        return conn
 
     def _init_db(self):
-        self.conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS tokens (
                 token_id TEXT PRIMARY KEY,
@@ -110,34 +197,42 @@ class TokenVault:
         os.chmod(self.db_file, 0o600)
 
     def encrypt_pii(self, value: str, pii_type: PIIType, provider: str = None) -> tuple[str, bool]:
-        value_hash = hashlib.sha256(value.encode()).hexdigest()[:12]
+        # BLAKE2b at 6 bytes gives the same 12 hex chars as the old
+        # sha256().hexdigest()[:12] without hashing/allocating a full
+        # 32-byte digest per match
+        value_hash = hashlib.blake2b(value.encode(), digest_size=6).hexdigest()
         token_id = f"◈PG:{pii_type.value[:4]}_{value_hash}◈"
 
-        cursor = self.conn.execute(
-            "SELECT token_id FROM tokens WHERE token_id = ?", (token_id,)
-        )
-        is_new = cursor.fetchone() is None
+        is_new = token_id not in self._known_ids
+        now = datetime.utcnow().isoformat()
+        self._total_uses += 1
 
         if not is_new:
             # Existing token - just update use count, no activity log
             self.conn.execute(
                 "UPDATE tokens SET last_used = ?, use_count = use_count + 1 WHERE token_id = ?",
-                (datetime.utcnow().isoformat(), token_id)
+                (now, token_id)
             )
             self.conn.commit()
         else:
             # New token - insert and log activity
+            self._known_ids.add(token_id)
+            self._total_tokens += 1
+            self._by_type[pii_type.value] += 1
+            if provider:
+                self._by_provider[provider] += 1
             encrypted = self.crypto.encrypt(value, pii_type.value).encode('utf-8')
             self.conn.execute(
                 "INSERT INTO tokens (token_id, pii_type, encrypted_value, created_at, last_used, provider) VALUES (?, ?, ?, ?, ?, ?)",
-                (token_id, pii_type.value, encrypted, datetime.utcnow().isoformat(), datetime.utcnow().isoformat(), provider)
+                (token_id, pii_type.value, encrypted, now, now, provider)
             )
 
-            # Log activity only for NEW tokens
+            # Log activity only for NEW tokens - same transaction as the
+            # token insert so there is a single commit per new token
             masked = f"{value[:3]}***{value[-3:]}" if len(value) > 6 else "***"
             self.conn.execute(
                 "INSERT INTO activity_log (timestamp, provider, pii_type, action, masked_value) VALUES (?, ?, ?, ?, ?)",
-                (datetime.utcnow().isoformat(), provider, pii_type.value, "protected", masked)
+                (now, provider, pii_type.value, "protected", masked)
             )
             self.conn.commit()
 
@@ -146,7 +241,7 @@ class TokenVault:
                 "type": pii_type.value,
                 "masked": masked,
                 "provider": provider,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             })
 
         return token_id, is_new
@@ -165,6 +260,11 @@ class TokenVault:
         return None
 
     def get_all_tokens(self) -> Dict[str, str]:
+        """Decrypt the entire vault - admin/export use only.
+
+        This is O(N) rows and N decrypts; the request path must never
+        call it (unprotect_text works per-token via the proxy cache).
+        """
         cursor = self.conn.execute("SELECT token_id, encrypted_value FROM tokens")
         result = {}
         for token_id, encrypted in cursor.fetchall():
@@ -188,22 +288,13 @@ class TokenVault:
         ]
 
     def stats(self) -> dict:
-        cursor = self.conn.execute("SELECT COUNT(*), SUM(use_count) FROM tokens")
-        count, uses = cursor.fetchone()
-
-        cursor = self.conn.execute("SELECT pii_type, COUNT(*) FROM tokens GROUP BY pii_type")
-        by_type = {row[0]: row[1] for row in cursor.fetchall()}
-
-        cursor = self.conn.execute(
-            "SELECT provider, COUNT(*) FROM activity_log WHERE provider IS NOT NULL GROUP BY provider"
-        )
-        by_provider = {row[0]: row[1] for row in cursor.fetchall()}
-
+        # Served from the maintained counters - O(1) regardless of vault
+        # size, safe to poll every second from the GUI
         return {
-            "total_tokens": count or 0,
-            "total_uses": uses or 0,
-            "by_type": by_type,
-            "by_provider": by_provider
+            "total_tokens": self._total_tokens,
+            "total_uses": self._total_uses,
+            "by_type": dict(self._by_type),
+            "by_provider": dict(self._by_provider)
         }
 
 
@@ -217,7 +308,18 @@ class PrivacyGuardianProxy:
     def __init__(self):
         self.detector = PIIDetector()
         self.vault = TokenVault()
-        self.client = httpx.AsyncClient(timeout=120.0, follow_redirects=True)
+        # HTTP/2 multiplexes concurrent requests over one TLS session per
+        # upstream; keep-alive limits avoid connection churn under load
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=500,
+                max_keepalive_connections=200,
+                keepalive_expiry=60.0,
+            ),
+            follow_redirects=True,
+        )
 
         # Stats
         self.requests_processed = 0
@@ -233,6 +335,23 @@ class PrivacyGuardianProxy:
         # Current provider context for parser
         self._current_provider = None
 
+        # Bounded cache of token -> plaintext so response/streaming chunks
+        # don't hit SQLite + libsodium for every token they contain
+        self._token_cache: OrderedDict[str, str] = OrderedDict()
+        self._token_cache_max = 10_000
+        self._token_re = re.compile(r'◈PG:[A-Z_]{1,4}_[0-9a-f]{12}◈')
+
+        # With pyahocorasick installed, cached tokens also live in an
+        # automaton so a chunk is scanned once for all of them; rebuilt
+        # lazily when new tokens arrive
+        self._ac = ahocorasick.Automaton() if ahocorasick is not None else None
+        self._ac_dirty = False
+        # add_word has no inverse, so cache evictions leave stale
+        # plaintext behind; count them and rebuild the automaton from
+        # the surviving entries once enough accumulate
+        self._ac_evictions = 0
+        self._ac_rebuild_evictions = 1024
+
     def _protect_text_for_parser(self, text: str) -> str:
         """Wrapper for parser that uses current provider context"""
         return self.protect_text(text, self._current_provider)
@@ -245,25 +364,106 @@ class PrivacyGuardianProxy:
         if not matches:
             return text
 
-        matches.sort(key=lambda m: m.start, reverse=True)
-
-        protected = text
+        # Single forward pass: collect untouched segments and tokens into a
+        # list and join once, instead of rebuilding the string per match.
+        # The detector already returns matches sorted by position.
+
+        # Bind hot lookups to locals - this loop runs per PII match on
+        # every request body
+        encrypt_pii = self.vault.encrypt_pii
+        cache_token = self._cache_token
+        parts = []
+        append = parts.append
+        last = 0
         for match in matches:
-            token, is_new = self.vault.encrypt_pii(match.value, match.pii_type, provider)
-            protected = protected[:match.start] + token + protected[match.end:]
+            token, is_new = encrypt_pii(match.value, match.pii_type, provider)
+            cache_token(token, match.value)
+            append(text[last:match.start])
+            append(token)
+            last = match.end
             if is_new:
                 self.pii_items_protected += 1
+        append(text[last:])
 
-        return protected
+        return ''.join(parts)
+
+    def protect_bytes(self, body: bytes, provider: str = None) -> bytes:
+        """Detect PII in a raw body and replace it with encrypted tokens.
+
+        Bytes in, bytes out: when nothing matched the original buffer is
+        returned as-is, skipping the re-encode pass entirely.
+        """
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            return body
+        protected = self.protect_text(text, provider)
+        if protected is text:
+            return body
+        return protected.encode('utf-8')
+
+    def _cache_token(self, token: str, value: str):
+        """Remember a token's plaintext, evicting the oldest entry when full"""
+        cache = self._token_cache
+        if token not in cache and self._ac is not None:
+            self._ac.add_word(token, (len(token), value))
+            self._ac_dirty = True
+        cache[token] = value
+        cache.move_to_end(token)
+        while len(cache) > self._token_cache_max:
+            cache.popitem(last=False)
+            self._ac_evictions += 1
+        # Evicted tokens stay in the automaton until this amortized
+        # rebuild; without it the cache cap would not bound the
+        # plaintext held in memory
+        if self._ac is not None and self._ac_evictions >= self._ac_rebuild_evictions:
+            self._rebuild_automaton()
+
+    def _rebuild_automaton(self):
+        """Rebuild the token automaton from the surviving cache entries"""
+        ac = ahocorasick.Automaton()
+        for token, value in self._token_cache.items():
+            ac.add_word(token, (len(token), value))
+        self._ac = ac
+        self._ac_dirty = True
+        self._ac_evictions = 0
 
     def unprotect_text(self, text: str) -> str:
         """Replace tokens with original PII values"""
-        tokens = self.vault.get_all_tokens()
-        result = text
-        for token, value in tokens.items():
-            if token in result:
-                result = result.replace(token, value)
-        return result
+        if '◈' not in text:
+            return text
+
+        # Fast path: one automaton pass substitutes every cached token
+        if self._ac is not None and len(self._ac) > 0:
+            if self._ac_dirty:
+                self._ac.make_automaton()
+                self._ac_dirty = False
+            parts = []
+            last = 0
+            for end, (token_len, value) in self._ac.iter(text):
+                start = end - token_len + 1
+                if start < last:
+                    continue
+                parts.append(text[last:start])
+                parts.append(value)
+                last = end + 1
+            parts.append(text[last:])
+            text = ''.join(parts)
+            # Tokens from an earlier run are not in the automaton yet;
+            # only those fall through to the vault lookup below
+            if '◈' not in text:
+                return text
+
+        def repl(match):
+            token = match.group(0)
+            value = self._token_cache.get(token)
+            if value is None:
+                value = self.vault.decrypt_token(token)
+                if value is not None:
+                    self._cache_token(token, value)
+            return value if value is not None else token
+
+        return self._token_re.sub(repl, text)
 
     async def proxy_request(self, request: Request) -> Response:
         """Proxy a request to the appropriate LLM API with PII protection"""
@@ -313,20 +513,15 @@ class PrivacyGuardianProxy:
             body, pii_count = self.parser.protect_request(body, provider)
         elif body:
             # Generic protection for unknown providers
-            try:
-                text = body.decode('utf-8')
-                protected = self.protect_text(text, provider_name)
-                body = protected.encode('utf-8')
-            except:
-                pass
+            body = self.protect_bytes(body, provider_name)
 
         # Check if streaming
         is_streaming = False
         if body:
             try:
-                req_json = json.loads(body)
+                req_json = orjson.loads(body)
                 is_streaming = req_json.get("stream", False)
-            except:
+            except orjson.JSONDecodeError:
                 pass
 
         # Emit request event
@@ -353,7 +548,7 @@ class PrivacyGuardianProxy:
             )
         except Exception as e:
             return Response(
-                content=json.dumps({"error": str(e)}),
+                content=orjson.dumps({"error": str(e)}),
                 status_code=502,
                 media_type="application/json"
             )
@@ -365,7 +560,7 @@ class PrivacyGuardianProxy:
         else:
             try:
                 content = self.unprotect_text(content.decode()).encode()
-            except:
+            except (orjson.JSONDecodeError, UnicodeDecodeError):
                 pass
 
         # Filter hop-by-hop headers
@@ -383,48 +578,46 @@ class PrivacyGuardianProxy:
         """Handle streaming request with real-time token unprotection"""
         streaming_parser = StreamingParser(self.unprotect_text)
 
+        # Open the stream once; the status line arrives before the body so
+        # we can still return error responses directly. The old approach
+        # issued the request twice (once to check status, once to stream),
+        # doubling latency and re-executing non-idempotent POSTs.
         try:
-            # Make the request and check status first
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                content=body
+            upstream_request = self.client.build_request(
+                method, url, headers=headers, content=body
             )
-
-            # If error response, return it directly (don't try to stream)
-            if response.status_code >= 400:
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers)
-                )
-
-            # For streaming, we need to make a new streaming request
-            async def stream_generator():
-                try:
-                    async with self.client.stream(method, url, headers=headers, content=body) as stream_response:
-                        # Check for errors
-                        if stream_response.status_code >= 400:
-                            yield stream_response.read()
-                            return
-                        async for chunk in stream_response.aiter_bytes():
-                            yield streaming_parser.process_chunk(chunk)
-                except Exception as e:
-                    yield f"data: {json.dumps({'error': str(e)})}\n\n".encode()
-
-            return StreamingResponse(
-                stream_generator(),
-                media_type="text/event-stream"
-            )
-
+            upstream = await self.client.send(upstream_request, stream=True)
         except Exception as e:
             return Response(
-                content=json.dumps({"error": str(e)}),
-                status_code=500,
+                content=orjson.dumps({"error": str(e)}),
+                status_code=502,
                 media_type="application/json"
             )
 
+        # If error response, return it directly (don't try to stream)
+        if upstream.status_code >= 400:
+            content = await upstream.aread()
+            await upstream.aclose()
+            return Response(
+                content=content,
+                status_code=upstream.status_code,
+                headers=dict(upstream.headers)
+            )
+
+        async def stream_generator():
+            try:
+                async for chunk in upstream.aiter_bytes():
+                    yield streaming_parser.process_chunk(chunk)
+            except Exception as e:
+                yield b"data: " + orjson.dumps({'error': str(e)}) + b"\n\n"
+            finally:
+                await upstream.aclose()
+
+        return StreamingResponse(
+            stream_generator(),
+            media_type="text/event-stream"
+        )
+
     def get_uptime(self) -> str:
         delta = datetime.utcnow() - self.start_time
         hours, remainder = divmod(int(delta.total_seconds()), 3600)
@@ -488,6 +681,33 @@ async def get_activity():
     return {"activity": guardian.vault.get_recent_activity(50)}
 
 
+@app.get("/__guardian__/dashboard")
+async def get_dashboard(request: Request):
+    """Combined stats + activity payload so the dashboard polls once, not twice.
+
+    Supports If-None-Match: the ETag covers everything except the uptime
+    string (which churns every second and would defeat caching), so idle
+    polls get a bodyless 304 instead of a full serialize + transfer.
+    """
+    stats = await get_stats()
+    activity = guardian.vault.get_recent_activity(50)
+
+    etag_src = {k: v for k, v in stats.items() if k != "uptime"}
+    etag = '"%s"' % hashlib.blake2b(
+        orjson.dumps({"stats": etag_src, "activity": activity}),
+        digest_size=8
+    ).hexdigest()
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=orjson.dumps({"stats": stats, "activity": activity}),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
 @app.get("/__guardian__/health")
 async def health_check():
     """Health check endpoint"""
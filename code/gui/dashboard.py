@@ -10,20 +10,83 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib, Gio, Gdk
-import json
+from gi.repository import Gtk, Adw, GLib, Gio, Gdk, GObject
+import concurrent.futures
+import functools
+import heapq
+import operator
+import shutil
+import socket
+import string
+import urllib.error
 import urllib.request
 import subprocess
 import threading
+import time
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None  # falls back to one-shot urllib.request connections
+
+try:
+    import orjson as _json  # C/SIMD parser, takes bytes directly
+except ImportError:
+    import json as _json
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from setup_wizard import SetupWizard, SUPPORTED_APPS, SetupError
 
+# One wizard for the whole process; construction is cheap but there is
+# no reason to rebuild it on every toggle/dialog
+_WIZARD = SetupWizard()
+
+# get_current_config_status() re-reads and greps the shell rc file; cache
+# it keyed on the rc file's mtime so a toggle is an in-memory check
+_CONFIG_STATUS_CACHE = {"mtime": None, "value": None}
+
+
+def _get_config_status() -> dict:
+    """Cached SetupWizard.get_current_config_status()"""
+    _, config_path = _WIZARD.detect_shell()
+    try:
+        mtime = config_path.stat().st_mtime if config_path else None
+    except OSError:
+        mtime = None
+    if _CONFIG_STATUS_CACHE["value"] is not None and _CONFIG_STATUS_CACHE["mtime"] == mtime:
+        return _CONFIG_STATUS_CACHE["value"]
+    value = _WIZARD.get_current_config_status()
+    _CONFIG_STATUS_CACHE["mtime"] = mtime
+    _CONFIG_STATUS_CACHE["value"] = value
+    return value
+
+
+def _invalidate_config_status():
+    """Drop the cached status after the setup wizard edits the rc file"""
+    _CONFIG_STATUS_CACHE["mtime"] = None
+    _CONFIG_STATUS_CACHE["value"] = None
+
+
+# Native crypto is loaded lazily: the GUI can run (dashboard, setup)
+# without libpgcrypto.so, which is only needed once the vault viewer
+# actually decrypts something
+_CRYPTO = None
+
+
+def _get_crypto():
+    """Process-wide CryptoNative instance, created on first use"""
+    global _CRYPTO
+    if _CRYPTO is None:
+        from crypto_native import get_crypto
+        _CRYPTO = get_crypto()
+    return _CRYPTO
+
 
 # Find guardian directory
 SCRIPT_DIR = Path(__file__).parent.parent.parent
@@ -32,6 +95,527 @@ VENV_PYTHON = SCRIPT_DIR / "venv" / "bin" / "python"
 CODE_DIR = SCRIPT_DIR / "code"
 FLAG_FILE = Path.home() / ".privacyguardian" / "enabled"
 
+# Shared keep-alive pool for all proxy calls. Every endpoint lives on
+# localhost:6660, so the stats/activity polls and health checks reuse one
+# TCP connection instead of paying a handshake every 2-second tick.
+if urllib3 is not None:
+    _HTTP = urllib3.PoolManager(num_pools=1, maxsize=4,
+                                headers={"Connection": "keep-alive"})
+else:
+    _HTTP = None
+
+
+# Activity row template: one Builder parse replaces the ~15 individual
+# widget construction/property calls per row. The ListView factory only
+# instantiates it for rows actually realized (viewport + recycling).
+_ACTIVITY_ROW_UI = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <object class="GtkBox" id="row">
+    <property name="orientation">horizontal</property>
+    <property name="spacing">12</property>
+    <property name="margin-start">8</property>
+    <property name="margin-end">8</property>
+    <property name="margin-top">4</property>
+    <property name="margin-bottom">4</property>
+    <style><class name="activity-row"/></style>
+    <child>
+      <object class="GtkLabel" id="type_label">
+        <property name="width-chars">10</property>
+        <style><class name="pii-type"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="masked_label">
+        <property name="hexpand">true</property>
+        <property name="halign">start</property>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="provider_label">
+        <style><class name="provider"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="time_label">
+        <style><class name="timestamp"/></style>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+# Static dashboard layout. One Builder parse builds the whole tree in C
+# instead of ~40 individual widget constructions and property sets
+# crossing the PyGObject FFI; _build_ui only wires signals and attaches
+# the dynamic list models.
+_DASHBOARD_UI = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <object class="GtkBox" id="main_box">
+    <property name="orientation">vertical</property>
+    <child>
+      <object class="AdwHeaderBar">
+        <property name="title-widget">
+          <object class="GtkLabel">
+            <property name="label">🛡️ PrivacyGuardian Control Center</property>
+          </object>
+        </property>
+        <child type="end">
+          <object class="GtkButton" id="setup_btn">
+            <property name="label">Setup</property>
+            <property name="tooltip-text">Configure which apps to protect</property>
+          </object>
+        </child>
+        <child type="end">
+          <object class="GtkButton" id="refresh_btn">
+            <property name="icon-name">view-refresh-symbolic</property>
+            <property name="tooltip-text">Refresh Status</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="AdwBanner" id="status_banner">
+        <property name="title">Checking status...</property>
+        <property name="revealed">true</property>
+      </object>
+    </child>
+    <child>
+      <object class="GtkScrolledWindow">
+        <property name="vexpand">true</property>
+        <child>
+          <object class="GtkBox" id="content_box">
+            <property name="orientation">vertical</property>
+            <property name="spacing">16</property>
+            <property name="margin-start">16</property>
+            <property name="margin-end">16</property>
+            <property name="margin-top">16</property>
+            <property name="margin-bottom">16</property>
+            <child>
+              <object class="GtkFrame">
+                <style><class name="card"/></style>
+                <child>
+                  <object class="GtkBox">
+                    <property name="orientation">horizontal</property>
+                    <property name="spacing">16</property>
+                    <property name="margin-start">20</property>
+                    <property name="margin-end">20</property>
+                    <property name="margin-top">16</property>
+                    <property name="margin-bottom">16</property>
+                    <child>
+                      <object class="GtkLabel">
+                        <property name="label">🛡️</property>
+                        <style><class name="title-1"/></style>
+                      </object>
+                    </child>
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">4</property>
+                        <property name="hexpand">true</property>
+                        <child>
+                          <object class="GtkLabel">
+                            <property name="label">Protection</property>
+                            <property name="xalign">0</property>
+                            <style><class name="title-2"/></style>
+                          </object>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="master_desc">
+                            <property name="label">Route LLM traffic through PrivacyGuardian</property>
+                            <property name="xalign">0</property>
+                            <style><class name="dim-label"/></style>
+                          </object>
+                        </child>
+                      </object>
+                    </child>
+                    <child>
+                      <object class="GtkSwitch" id="protection_switch">
+                        <property name="valign">center</property>
+                      </object>
+                    </child>
+                  </object>
+                </child>
+              </object>
+            </child>
+            <child>
+              <object class="GtkBox">
+                <property name="orientation">horizontal</property>
+                <property name="spacing">12</property>
+                <property name="halign">center</property>
+                <property name="margin-top">8</property>
+                <child>
+                  <object class="GtkButton" id="test_btn">
+                    <property name="label">🧪 Test Protection</property>
+                    <property name="tooltip-text">Send a test message with fake PII to verify protection</property>
+                  </object>
+                </child>
+                <child>
+                  <object class="GtkButton" id="view_logs_btn">
+                    <property name="label">📋 View Logs</property>
+                    <property name="tooltip-text">Open terminal with service logs</property>
+                  </object>
+                </child>
+                <child>
+                  <object class="GtkButton" id="open_vault_btn">
+                    <property name="label">🔐 Open Vault Folder</property>
+                    <property name="tooltip-text">Open the encrypted vault folder</property>
+                  </object>
+                </child>
+                <child>
+                  <object class="GtkButton" id="access_vault_btn">
+                    <property name="label">🔑 Access Vault</property>
+                    <property name="tooltip-text">View and copy your protected data</property>
+                  </object>
+                </child>
+              </object>
+            </child>
+            <child>
+              <object class="GtkLabel">
+                <property name="label">Protection Statistics</property>
+                <property name="xalign">0</property>
+                <style><class name="title-3"/></style>
+              </object>
+            </child>
+            <child>
+              <object class="GtkBox">
+                <property name="orientation">horizontal</property>
+                <property name="spacing">12</property>
+                <property name="homogeneous">true</property>
+                <child>
+                  <object class="GtkFrame" id="status_card">
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">4</property>
+                        <property name="margin-start">12</property>
+                        <property name="margin-end">12</property>
+                        <property name="margin-top">12</property>
+                        <property name="margin-bottom">12</property>
+                        <child>
+                          <object class="GtkBox">
+                            <property name="orientation">horizontal</property>
+                            <property name="spacing">8</property>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">🔒</property>
+                              </object>
+                            </child>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">Status</property>
+                                <property name="opacity">0.7</property>
+                                <style><class name="caption"/></style>
+                              </object>
+                            </child>
+                          </object>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="status_value">
+                            <property name="label">---</property>
+                            <property name="halign">start</property>
+                            <style><class name="title-2"/></style>
+                          </object>
+                        </child>
+                      </object>
+                    </child>
+                  </object>
+                </child>
+                <child>
+                  <object class="GtkFrame" id="uptime_card">
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">4</property>
+                        <property name="margin-start">12</property>
+                        <property name="margin-end">12</property>
+                        <property name="margin-top">12</property>
+                        <property name="margin-bottom">12</property>
+                        <child>
+                          <object class="GtkBox">
+                            <property name="orientation">horizontal</property>
+                            <property name="spacing">8</property>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">⏱️</property>
+                              </object>
+                            </child>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">Uptime</property>
+                                <property name="opacity">0.7</property>
+                                <style><class name="caption"/></style>
+                              </object>
+                            </child>
+                          </object>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="uptime_value">
+                            <property name="label">---</property>
+                            <property name="halign">start</property>
+                            <style><class name="title-2"/></style>
+                          </object>
+                        </child>
+                      </object>
+                    </child>
+                  </object>
+                </child>
+                <child>
+                  <object class="GtkFrame" id="protected_card">
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">4</property>
+                        <property name="margin-start">12</property>
+                        <property name="margin-end">12</property>
+                        <property name="margin-top">12</property>
+                        <property name="margin-bottom">12</property>
+                        <child>
+                          <object class="GtkBox">
+                            <property name="orientation">horizontal</property>
+                            <property name="spacing">8</property>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">✅</property>
+                              </object>
+                            </child>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">Items Protected</property>
+                                <property name="opacity">0.7</property>
+                                <style><class name="caption"/></style>
+                              </object>
+                            </child>
+                          </object>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="protected_value">
+                            <property name="label">0</property>
+                            <property name="halign">start</property>
+                            <style><class name="title-2"/></style>
+                          </object>
+                        </child>
+                      </object>
+                    </child>
+                  </object>
+                </child>
+                <child>
+                  <object class="GtkFrame" id="requests_card">
+                    <child>
+                      <object class="GtkBox">
+                        <property name="orientation">vertical</property>
+                        <property name="spacing">4</property>
+                        <property name="margin-start">12</property>
+                        <property name="margin-end">12</property>
+                        <property name="margin-top">12</property>
+                        <property name="margin-bottom">12</property>
+                        <child>
+                          <object class="GtkBox">
+                            <property name="orientation">horizontal</property>
+                            <property name="spacing">8</property>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">📡</property>
+                              </object>
+                            </child>
+                            <child>
+                              <object class="GtkLabel">
+                                <property name="label">Requests</property>
+                                <property name="opacity">0.7</property>
+                                <style><class name="caption"/></style>
+                              </object>
+                            </child>
+                          </object>
+                        </child>
+                        <child>
+                          <object class="GtkLabel" id="requests_value">
+                            <property name="label">0</property>
+                            <property name="halign">start</property>
+                            <style><class name="title-2"/></style>
+                          </object>
+                        </child>
+                      </object>
+                    </child>
+                  </object>
+                </child>
+              </object>
+            </child>
+            <child>
+              <object class="GtkLabel">
+                <property name="label">Recent Activity</property>
+                <property name="xalign">0</property>
+                <style><class name="title-3"/></style>
+              </object>
+            </child>
+            <child>
+              <object class="GtkFrame" id="activity_frame">
+                <child>
+                  <object class="GtkLabel" id="activity_placeholder">
+                    <property name="label">No activity yet - send a message to any LLM to see protection in action</property>
+                    <property name="opacity">0.5</property>
+                    <property name="margin-top">16</property>
+                    <property name="margin-bottom">16</property>
+                  </object>
+                </child>
+              </object>
+            </child>
+            <child>
+              <object class="GtkLabel">
+                <property name="label">Protected by Type</property>
+                <property name="xalign">0</property>
+                <style><class name="title-3"/></style>
+              </object>
+            </child>
+            <child>
+              <object class="GtkFrame" id="type_frame">
+                <child>
+                  <object class="GtkLabel" id="type_placeholder">
+                    <property name="label">No data yet</property>
+                    <property name="opacity">0.5</property>
+                    <property name="margin-top">16</property>
+                    <property name="margin-bottom">16</property>
+                  </object>
+                </child>
+              </object>
+            </child>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+# Dashboard styling; parsed into a provider once per process (_apply_css)
+_CSS_BYTES = b"""
+.title-3 {
+    font-weight: bold;
+    font-size: 16px;
+    margin-top: 8px;
+}
+.heading {
+    font-weight: bold;
+    font-size: 14px;
+    margin-top: 8px;
+}
+.activity-row {
+    padding: 8px;
+}
+.pii-type {
+    font-family: monospace;
+    font-weight: bold;
+}
+.timestamp {
+    opacity: 0.6;
+    font-size: 11px;
+}
+.provider {
+    opacity: 0.8;
+}
+.status-active {
+    color: #2ec27e;
+}
+.status-inactive {
+    color: #c01c28;
+}
+"""
+
+
+# Terminal emulator argv prefixes, in order of preference; the reload
+# script is appended as the final argument at spawn time
+_TERMINALS = [
+    ['gnome-terminal', '--', 'bash', '-c'],
+    ['konsole', '-e', 'bash', '-c'],
+    ['xfce4-terminal', '-x', 'bash', '-c'],
+    ['mate-terminal', '-x', 'bash', '-c'],
+    ['tilix', '-e', 'bash', '-c'],
+    ['xterm', '-e', 'bash', '-c'],
+]
+
+
+# Login shell, read once: the environment cannot change under a running
+# process, so there is nothing to re-query per spawn
+_SHELL = os.environ.get('SHELL', '/bin/bash')
+
+# The reload-terminal banner script is constant apart from two slots;
+# building it as a Template at import time replaces per-spawn f-string
+# assembly of the whole block with one substitute() call
+_RELOAD_TPL = string.Template('''
+echo ""
+echo "╔════════════════════════════════════════════════════════════════╗"
+echo "║         PrivacyGuardian Setup - One Last Step!                 ║"
+echo "╠════════════════════════════════════════════════════════════════╣"
+echo "║                                                                ║"
+echo "║  Press ENTER to reload your shell configuration.              ║"
+echo "║  This is the only manual step required!                        ║"
+echo "║                                                                ║"
+echo "║  After this, you can use 'claude' with protection enabled.    ║"
+echo "║                                                                ║"
+echo "╚════════════════════════════════════════════════════════════════╝"
+echo ""
+echo "Command: $reload_cmd"
+echo ""
+read -p ">>> Press ENTER to continue... "
+$reload_cmd
+echo ""
+echo "Done! You can now use this terminal with protection enabled."
+echo "Try: claude --help"
+echo ""
+exec $shell
+''')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_clipboard():
+    """The default display's clipboard, resolved once per process.
+
+    Gdk.Display.get_default() walks the display manager on every call;
+    the clipboard object itself is a stable singleton, so cache it.
+    """
+    return Gdk.Display.get_default().get_clipboard()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_terminal():
+    """First available terminal emulator's argv prefix.
+
+    Cached so PATH is scanned once per process instead of per spawn.
+    """
+    return next((t for t in _TERMINALS if shutil.which(t[0])), None)
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_ts(ts: str) -> str:
+    """Format an ISO timestamp as HH:MM:SS.
+
+    Cached: the activity log is append-only, so the same timestamp
+    strings recur on every poll and skip the re-parse.
+    """
+    try:
+        return datetime.fromisoformat(ts).strftime("%H:%M:%S")
+    except (ValueError, TypeError):
+        return ts[:8]
+
+
+def _http_get(url: str, timeout: float = 2.0, headers: dict = None):
+    """GET a proxy endpoint, reusing the keep-alive pool when available.
+
+    Returns an object with .status, .data (bytes) and .headers, matching
+    the urllib3 response shape.
+    """
+    if _HTTP is not None:
+        return _HTTP.request("GET", url, timeout=timeout, retries=False,
+                             headers=headers)
+    req = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return SimpleNamespace(status=resp.status, data=resp.read(),
+                                   headers=dict(resp.headers))
+    except urllib.error.HTTPError as e:
+        # Non-2xx (e.g. 304 Not Modified) is a response, not a failure
+        return SimpleNamespace(status=e.code, data=b"", headers=dict(e.headers))
+
 
 class PrivacyGuardianApp(Adw.Application):
     """Main application class"""
@@ -42,12 +626,47 @@ class PrivacyGuardianApp(Adw.Application):
             flags=Gio.ApplicationFlags.FLAGS_NONE
         )
         self.window = None
+        # One pool for all background work (polling, commands, tests)
+        # instead of a fresh short-lived thread per action
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="pg"
+        )
 
     def do_activate(self):
         if not self.window:
             self.window = DashboardWindow(application=self)
         self.window.present()
 
+    def do_shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        Adw.Application.do_shutdown(self)
+
+
+class ActivityItem(GObject.Object):
+    """One recent-activity event backing a dashboard list row.
+
+    Display strings are derived once at construction so the ListView
+    bind callback is nothing but set_text() calls.
+    """
+
+    def __init__(self, item: dict):
+        super().__init__()
+        self.type_text = item.get("pii_type", "UNKNOWN")[:10]
+        self.masked_text = item.get("masked_value", "***")
+        provider = item.get("provider", "")
+        self.provider_text = f"→ {provider}" if provider else ""
+        timestamp = item.get("timestamp", "")
+        self.time_text = _fmt_ts(timestamp) if timestamp else ""
+
+
+class TypeItem(GObject.Object):
+    """One (pii_type, count) entry in the type-breakdown list"""
+
+    def __init__(self, pii_type, count):
+        super().__init__()
+        self.type_text = pii_type
+        self.count_text = str(count)
+
 
 class DashboardWindow(Adw.ApplicationWindow):
     """Main dashboard window with full control panel"""
@@ -65,247 +684,127 @@ class DashboardWindow(Adw.ApplicationWindow):
         self.proxy_running = False
         self.protection_enabled = FLAG_FILE.exists()
 
+        # Reusable error dialogs, keyed by heading
+        self._error_dialogs = {}
+
+        # Adaptive polling state: poll fast while data changes, back off
+        # toward 30 s when it doesn't, stop entirely while hidden
+        self._poll_interval_ms = 1000
+        self._poll_source = None
+        self._polling_paused = False
+        self._last_payload_hash = None
+        self._consec_failures = 0
+        self._etag = None
+        self._fetch_inflight = False  # single-flight: one poll at a time
+        # Focus state snapshotted on the main thread before each fetch;
+        # the worker must not call widget methods like is_active()
+        self._win_focused = True
+
+        # Model-backed lists: an update is one Gio.ListStore splice and
+        # GTK recycles the realized row widgets; the payload hashes skip
+        # even that when a poll returns identical data
+        self._last_activity_hash = None
+        self._last_type_hash = None
+        # Identity keys of the rows currently in the activity model, so
+        # new events can be prepended instead of replacing all 20 rows
+        self._activity_keys = []
+
         # Build UI
         self._build_ui()
 
+        # Watch the flag directory so external enable/disable toggles are
+        # event-driven instead of a stat() on every poll tick
+        flag_dir = Gio.File.new_for_path(str(FLAG_FILE.parent))
+        self._flag_monitor = flag_dir.monitor_directory(Gio.FileMonitorFlags.NONE, None)
+        self._flag_monitor.connect("changed", self._on_flag_changed)
+
         # Start polling
         self._start_polling()
 
     def _build_ui(self):
-        """Build the main UI"""
-        # Main layout
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.set_content(main_box)
+        """Build the main UI from the Builder template.
 
-        # Header bar
-        header = Adw.HeaderBar()
-        title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        title_box.append(Gtk.Label(label="🛡️ PrivacyGuardian Control Center"))
-        header.set_title_widget(title_box)
-
-        # Setup button in header
-        setup_btn = Gtk.Button(label="Setup")
-        setup_btn.set_tooltip_text("Configure which apps to protect")
-        setup_btn.connect("clicked", self._on_setup_clicked)
-        header.pack_end(setup_btn)
-
-        # Refresh button in header
-        refresh_btn = Gtk.Button(icon_name="view-refresh-symbolic")
-        refresh_btn.set_tooltip_text("Refresh Status")
-        refresh_btn.connect("clicked", lambda _: self._refresh_all())
-        header.pack_end(refresh_btn)
-
-        main_box.append(header)
+        The static widget tree comes from one C-side Builder parse of
+        _DASHBOARD_UI; this method only wires signals, seeds dynamic
+        state and hooks the list models up to their frames.
+        """
+        builder = Gtk.Builder.new_from_string(_DASHBOARD_UI, -1)
+        get = builder.get_object
 
-        # Status banner
-        self.status_banner = Adw.Banner()
-        self.status_banner.set_title("Checking status...")
-        self.status_banner.set_revealed(True)
-        main_box.append(self.status_banner)
+        self.set_content(get("main_box"))
 
-        # Scrollable content
-        scroll = Gtk.ScrolledWindow()
-        scroll.set_vexpand(True)
-        main_box.append(scroll)
+        get("setup_btn").connect("clicked", self._on_setup_clicked)
+        get("refresh_btn").connect("clicked", lambda _: self._refresh_all())
 
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        content_box.set_margin_start(16)
-        content_box.set_margin_end(16)
-        content_box.set_margin_top(16)
-        content_box.set_margin_bottom(16)
-        scroll.set_child(content_box)
+        self.status_banner = get("status_banner")
+        self.master_desc = get("master_desc")
 
-        # ===================
-        # MASTER PROTECTION TOGGLE
-        # ===================
-        master_frame = Gtk.Frame()
-        master_frame.add_css_class("card")
-        master_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
-        master_box.set_margin_start(20)
-        master_box.set_margin_end(20)
-        master_box.set_margin_top(16)
-        master_box.set_margin_bottom(16)
-        master_frame.set_child(master_box)
-        content_box.append(master_frame)
-
-        # Shield icon and text
-        shield_label = Gtk.Label(label="🛡️")
-        shield_label.add_css_class("title-1")
-        master_box.append(shield_label)
-
-        master_text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        master_text_box.set_hexpand(True)
-        master_box.append(master_text_box)
-
-        master_title = Gtk.Label(label="Protection", xalign=0)
-        master_title.add_css_class("title-2")
-        master_text_box.append(master_title)
-
-        self.master_desc = Gtk.Label(label="Route LLM traffic through PrivacyGuardian", xalign=0)
-        self.master_desc.add_css_class("dim-label")
-        master_text_box.append(self.master_desc)
-
-        # The toggle switch
-        self.protection_switch = Gtk.Switch()
-        self.protection_switch.set_valign(Gtk.Align.CENTER)
+        self.protection_switch = get("protection_switch")
         self.protection_switch.set_active(self.protection_enabled)
         self.protection_switch.connect("state-set", self._on_protection_toggle)
-        master_box.append(self.protection_switch)
 
-        # ===================
-        # QUICK ACTIONS
-        # ===================
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        actions_row.set_halign(Gtk.Align.CENTER)
-        actions_row.set_margin_top(8)
-        content_box.append(actions_row)
-
-        test_btn = Gtk.Button(label="🧪 Test Protection")
-        test_btn.set_tooltip_text("Send a test message with fake PII to verify protection")
-        test_btn.connect("clicked", self._on_test_protection)
-        actions_row.append(test_btn)
-
-        view_logs_btn = Gtk.Button(label="📋 View Logs")
-        view_logs_btn.set_tooltip_text("Open terminal with service logs")
-        view_logs_btn.connect("clicked", self._on_view_logs)
-        actions_row.append(view_logs_btn)
-
-        open_vault_btn = Gtk.Button(label="🔐 Open Vault Folder")
-        open_vault_btn.set_tooltip_text("Open the encrypted vault folder")
-        open_vault_btn.connect("clicked", self._on_open_vault)
-        actions_row.append(open_vault_btn)
-
-        access_vault_btn = Gtk.Button(label="🔑 Access Vault")
-        access_vault_btn.set_tooltip_text("View and copy your protected data")
-        access_vault_btn.connect("clicked", self._on_access_vault)
-        actions_row.append(access_vault_btn)
-
-        # ===================
-        # STATS CARDS
-        # ===================
-        stats_label = Gtk.Label(label="Protection Statistics", xalign=0)
-        stats_label.add_css_class("title-3")
-        content_box.append(stats_label)
+        get("test_btn").connect("clicked", self._on_test_protection)
+        get("view_logs_btn").connect("clicked", self._on_view_logs)
+        get("open_vault_btn").connect("clicked", self._on_open_vault)
+        get("access_vault_btn").connect("clicked", self._on_access_vault)
 
-        stats_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        stats_row.set_homogeneous(True)
-        content_box.append(stats_row)
-
-        self.status_card = self._create_stat_card("Status", "---", "🔒")
-        self.uptime_card = self._create_stat_card("Uptime", "---", "⏱️")
-        self.protected_card = self._create_stat_card("Items Protected", "0", "✅")
-        self.requests_card = self._create_stat_card("Requests", "0", "📡")
-
-        stats_row.append(self.status_card)
-        stats_row.append(self.uptime_card)
-        stats_row.append(self.protected_card)
-        stats_row.append(self.requests_card)
+        # Stat cards: keep the frame.value_label convention _write_ui uses
+        for name in ("status", "uptime", "protected", "requests"):
+            card = get(f"{name}_card")
+            card.value_label = get(f"{name}_value")
+            setattr(self, f"{name}_card", card)
 
         # ===================
         # ACTIVITY SECTION
         # ===================
-        activity_label = Gtk.Label(label="Recent Activity", xalign=0)
-        activity_label.add_css_class("title-3")
-        content_box.append(activity_label)
+        self._activity_store = Gio.ListStore.new(ActivityItem)
+        activity_factory = Gtk.SignalListItemFactory()
+        activity_factory.connect("setup", self._setup_activity_row)
+        activity_factory.connect("bind", self._bind_activity_row)
 
-        self.activity_list = Gtk.ListBox()
-        self.activity_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.activity_list.add_css_class("boxed-list")
+        self.activity_list = Gtk.ListView.new(
+            Gtk.NoSelection.new(self._activity_store), activity_factory)
+        self.activity_list.add_css_class("rich-list")
 
-        activity_frame = Gtk.Frame()
-        activity_frame.set_child(self.activity_list)
-        content_box.append(activity_frame)
+        # The frame shows either the list or the placeholder; swapped in
+        # _update_activity_list when the data goes empty/non-empty
+        self._activity_placeholder = get("activity_placeholder")
+        self._activity_frame = get("activity_frame")
 
         # ===================
         # TYPE BREAKDOWN
         # ===================
-        type_label = Gtk.Label(label="Protected by Type", xalign=0)
-        type_label.add_css_class("title-3")
-        content_box.append(type_label)
+        self._type_store = Gio.ListStore.new(TypeItem)
+        type_factory = Gtk.SignalListItemFactory()
+        type_factory.connect("setup", self._setup_type_row)
+        type_factory.connect("bind", self._bind_type_row)
 
-        self.type_list = Gtk.ListBox()
-        self.type_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.type_list.add_css_class("boxed-list")
+        self.type_list = Gtk.ListView.new(
+            Gtk.NoSelection.new(self._type_store), type_factory)
+        self.type_list.add_css_class("rich-list")
 
-        type_frame = Gtk.Frame()
-        type_frame.set_child(self.type_list)
-        content_box.append(type_frame)
+        self._type_placeholder = get("type_placeholder")
+        self._type_frame = get("type_frame")
 
         # Apply CSS
         self._apply_css()
 
-    def _create_stat_card(self, title: str, value: str, icon: str) -> Gtk.Frame:
-        """Create a statistics card widget"""
-        frame = Gtk.Frame()
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        frame.set_child(box)
-
-        # Icon and title row
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        icon_label = Gtk.Label(label=icon)
-        header_box.append(icon_label)
-
-        title_label = Gtk.Label(label=title)
-        title_label.set_opacity(0.7)
-        title_label.add_css_class("caption")
-        header_box.append(title_label)
-        box.append(header_box)
-
-        # Value
-        value_label = Gtk.Label(label=value)
-        value_label.add_css_class("title-2")
-        value_label.set_halign(Gtk.Align.START)
-        box.append(value_label)
-
-        frame.value_label = value_label
-        return frame
+    # Set once the provider has been added to the display; re-parsing and
+    # re-adding it for every window instantiation is wasted work
+    _css_installed = False
 
     def _apply_css(self):
-        """Apply custom CSS styling"""
-        css = b"""
-        .title-3 {
-            font-weight: bold;
-            font-size: 16px;
-            margin-top: 8px;
-        }
-        .heading {
-            font-weight: bold;
-            font-size: 14px;
-            margin-top: 8px;
-        }
-        .activity-row {
-            padding: 8px;
-        }
-        .pii-type {
-            font-family: monospace;
-            font-weight: bold;
-        }
-        .timestamp {
-            opacity: 0.6;
-            font-size: 11px;
-        }
-        .provider {
-            opacity: 0.8;
-        }
-        .status-active {
-            color: #2ec27e;
-        }
-        .status-inactive {
-            color: #c01c28;
-        }
-        """
+        """Apply custom CSS styling (once per process)"""
+        if DashboardWindow._css_installed:
+            return
         provider = Gtk.CssProvider()
-        provider.load_from_data(css)
+        provider.load_from_data(_CSS_BYTES)
         Gtk.StyleContext.add_provider_for_display(
             self.get_display(),
             provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        DashboardWindow._css_installed = True
 
     # ===================
     # CONTROL ACTIONS
@@ -314,28 +813,35 @@ class DashboardWindow(Adw.ApplicationWindow):
     def _on_protection_toggle(self, switch, state):
         """Handle master protection toggle"""
         if state:
-            # Check if setup has been completed (aliases installed)
-            from setup_wizard import SetupWizard
-            wizard = SetupWizard()
-            status = wizard.get_current_config_status()
-
-            if not status.get('already_configured'):
-                # Revert the switch and prompt user to run setup first
-                switch.set_active(False)
-                self._show_error_dialog(
-                    "Setup Required",
-                    "Please click the Setup button first to configure your shell.\n\n"
-                    "This only needs to be done once."
-                )
-                return True  # Prevent switch from toggling
-
-            self._show_toast("Enabling protection...")
-            self._run_command_async(["enable"], self._on_protection_enabled)
+            # The setup check reads the shell rc file (disk I/O on a
+            # cache miss); run it on the worker pool so the switch
+            # animates immediately instead of stuttering on first toggle
+            self.get_application().executor.submit(self._check_setup_then_enable)
         else:
             self._show_toast("Disabling protection...")
             self._run_command_async(["disable"], self._on_protection_disabled)
         return False  # Let the switch update
 
+    def _check_setup_then_enable(self):
+        """Worker: read the setup status, finish the toggle on idle"""
+        status = _get_config_status()
+        GLib.idle_add(self._finish_enable_toggle, status)
+
+    def _finish_enable_toggle(self, status):
+        """Continue the enable toggle once the setup status is known"""
+        if not status.get('already_configured'):
+            # Revert the switch and prompt user to run setup first
+            self.protection_switch.set_active(False)
+            self._show_error_dialog(
+                "Setup Required",
+                "Please click the Setup button first to configure your shell.\n\n"
+                "This only needs to be done once."
+            )
+            return False
+        self._show_toast("Enabling protection...")
+        self._run_command_async(["enable"], self._on_protection_enabled)
+        return False  # one-shot idle callback
+
     def _on_protection_enabled(self, success, output):
         """Called when protection is enabled"""
         if success:
@@ -352,11 +858,11 @@ class DashboardWindow(Adw.ApplicationWindow):
     def _verify_proxy_health(self):
         """Verify the proxy is actually running and responding"""
         try:
-            with urllib.request.urlopen(f"{self.proxy_url}/__guardian__/stats", timeout=3) as resp:
-                if resp.status == 200:
-                    self._show_toast("Protection enabled and verified!")
-                    self._refresh_all()
-                    return False  # Stop timeout
+            resp = _http_get(f"{self.proxy_url}/__guardian__/stats", timeout=3)
+            if resp.status == 200:
+                self._show_toast("Protection enabled and verified!")
+                self._refresh_all()
+                return False  # Stop timeout
         except Exception:
             pass
 
@@ -374,22 +880,12 @@ class DashboardWindow(Adw.ApplicationWindow):
     def _on_test_protection(self, button):
         """Test the protection with fake PII"""
         self._show_toast("Running protection test...")
-        threading.Thread(target=self._run_test, daemon=True).start()
+        self.get_application().executor.submit(self._run_test)
 
     def _run_test(self):
         """Run a test request through the proxy"""
         try:
-            import urllib.request
-
-            # Create test data with fake PII
-
-            req = urllib.request.Request(
-                f"{self.proxy_url}/__guardian__/health",
-                method="GET"
-            )
-
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                resp.read().decode()
+            _http_get(f"{self.proxy_url}/__guardian__/health", timeout=5)
 
             GLib.idle_add(self._show_toast, "Test completed! Proxy is working.")
             GLib.idle_add(self._refresh_all)
@@ -431,34 +927,95 @@ class DashboardWindow(Adw.ApplicationWindow):
     # ===================
 
     def _run_command_async(self, args: list, callback):
-        """Run a guardian command asynchronously"""
+        """Run a guardian command asynchronously.
+
+        enable/disable are handled in-process (they only touch the flag
+        file and start/stop the proxy); shelling out to ./guardian would
+        fork, exec and re-import a whole interpreter per toggle. Other
+        commands go through the CLI via Gio.Subprocess, whose completion
+        is delivered on the main loop directly - no worker thread is
+        parked waiting on the child.
+        """
+        if args[0] not in ("start", "enable", "disable"):
+            try:
+                launcher = Gio.SubprocessLauncher.new(
+                    Gio.SubprocessFlags.STDOUT_PIPE
+                    | Gio.SubprocessFlags.STDERR_PIPE)
+                launcher.set_cwd(str(SCRIPT_DIR))
+                proc = launcher.spawnv([str(GUARDIAN_SCRIPT)] + args)
+            except GLib.Error as e:
+                callback(False, str(e))
+                return
+
+            def on_done(proc, result):
+                try:
+                    _, stdout, stderr = proc.communicate_utf8_finish(result)
+                    callback(proc.get_successful(),
+                             (stdout or "") + (stderr or ""))
+                except GLib.Error as e:
+                    callback(False, str(e))
+
+            proc.communicate_utf8_async(None, None, on_done)
+            return
+
         def run():
             try:
                 # For start command, we need to run proxy in background
                 if args[0] == "start":
-                    # Start proxy as background process
-                    subprocess.Popen(
-                        [str(VENV_PYTHON), str(CODE_DIR / "guardian_proxy.py")],
-                        cwd=str(CODE_DIR),
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        start_new_session=True
-                    )
+                    self._spawn_proxy()
                     GLib.idle_add(callback, True, "Started")
+                elif args[0] == "enable":
+                    GLib.idle_add(callback, *self._enable_inprocess())
                 else:
-                    result = subprocess.run(
-                        [str(GUARDIAN_SCRIPT)] + args,
-                        capture_output=True,
-                        text=True,
-                        cwd=str(SCRIPT_DIR)
-                    )
-                    success = result.returncode == 0
-                    output = result.stdout + result.stderr
-                    GLib.idle_add(callback, success, output)
+                    GLib.idle_add(callback, *self._disable_inprocess())
             except Exception as e:
                 GLib.idle_add(callback, False, str(e))
 
-        threading.Thread(target=run, daemon=True).start()
+        self.get_application().executor.submit(run)
+
+    def _spawn_proxy(self):
+        """Start the proxy as a detached background process"""
+        subprocess.Popen(
+            [str(VENV_PYTHON), str(CODE_DIR / "guardian_proxy.py")],
+            cwd=str(CODE_DIR),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+    def _proxy_alive(self) -> bool:
+        """Quick health-endpoint check"""
+        try:
+            return _http_get(f"{self.proxy_url}/__guardian__/health").status == 200
+        except Exception:
+            return False
+
+    def _enable_inprocess(self):
+        """Mirror './guardian enable': start proxy if needed, set the flag"""
+        FLAG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        if not self._proxy_alive():
+            self._spawn_proxy()
+            for _ in range(10):
+                time.sleep(0.5)
+                if self._proxy_alive():
+                    break
+            else:
+                return False, "Proxy failed to start"
+        FLAG_FILE.touch()
+        return True, "Protection enabled"
+
+    def _disable_inprocess(self):
+        """Mirror './guardian disable': clear the flag, stop the proxy"""
+        if FLAG_FILE.exists():
+            FLAG_FILE.unlink()
+        result = subprocess.run(
+            ["systemctl", "--user", "stop", "privacyguardian"],
+            capture_output=True
+        )
+        if result.returncode != 0:
+            # Not installed as a service - kill any manually started proxy
+            subprocess.run(["pkill", "-f", "guardian_proxy.py"], capture_output=True)
+        return True, "Protection disabled"
 
     def _show_toast(self, message: str):
         """Show a toast notification"""
@@ -469,12 +1026,17 @@ class DashboardWindow(Adw.ApplicationWindow):
 
     def _show_error_dialog(self, title: str, message: str):
         """Show an error dialog"""
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=title,
-            body=message
-        )
-        dialog.add_response("ok", "OK")
+        dialog = self._error_dialogs.get(title)
+        if dialog is None:
+            dialog = Adw.MessageDialog(
+                transient_for=self,
+                heading=title
+            )
+            dialog.add_response("ok", "OK")
+            # Hide on response so the cached dialog survives reuse
+            dialog.set_hide_on_close(True)
+            self._error_dialogs[title] = dialog
+        dialog.set_body(message)
         dialog.present()
 
     def _refresh_all(self):
@@ -482,6 +1044,20 @@ class DashboardWindow(Adw.ApplicationWindow):
         self._refresh_data()
         return False  # Don't repeat
 
+    def _on_flag_changed(self, monitor, gfile, other_file, event_type):
+        """React to the flag file appearing/disappearing (external toggles)"""
+        if gfile.get_basename() != FLAG_FILE.name:
+            return
+        current_flag = FLAG_FILE.exists()
+        if current_flag == self.protection_enabled:
+            return
+        self.protection_enabled = current_flag
+        self.protection_switch.set_active(current_flag)
+        if current_flag:
+            self.master_desc.set_text("Protection is ON - LLM traffic routed through proxy")
+        else:
+            self.master_desc.set_text("Protection is OFF - LLM traffic goes direct")
+
     # ===================
     # POLLING & DATA
     # ===================
@@ -489,46 +1065,164 @@ class DashboardWindow(Adw.ApplicationWindow):
     def _start_polling(self):
         """Start polling the proxy for updates"""
         self._refresh_data()
-        GLib.timeout_add_seconds(2, self._poll_tick)
+        self._poll_source = GLib.timeout_add(self._poll_interval_ms, self._poll_tick)
+        # Suspend polling while the window is hidden
+        self.connect("map", self._on_visibility_changed)
+        self.connect("unmap", self._on_visibility_changed)
 
     def _poll_tick(self) -> bool:
-        """Polling tick"""
-        threading.Thread(target=self._fetch_data, daemon=True).start()
-        return True
+        """Polling tick - self-rescheduling so interval changes take effect"""
+        if self._polling_paused:
+            self._poll_source = None
+            return False  # source cancelled; re-armed on map
+        # Never stack fetches: if the previous one is still waiting on a
+        # slow/hung proxy, this tick is a no-op and the timer just re-arms
+        if not self._fetch_inflight:
+            self._fetch_inflight = True
+            self._win_focused = self.is_active()
+            self.get_application().executor.submit(self._fetch_data)
+        self._poll_source = GLib.timeout_add(self._poll_interval_ms, self._poll_tick)
+        return False
+
+    def _on_visibility_changed(self, *args):
+        """Pause polling while unmapped, resume (fast) when shown again"""
+        paused = not self.get_mapped()
+        if paused == self._polling_paused:
+            return
+        self._polling_paused = paused
+        if not paused and self._poll_source is None:
+            self._poll_interval_ms = 1000
+            self._refresh_data()
+            self._poll_source = GLib.timeout_add(self._poll_interval_ms, self._poll_tick)
+
+    def _adapt_interval(self, changed: bool):
+        """Tune the polling interval to how fast the data is moving"""
+        if changed:
+            # Poll fast while focused, a touch slower in the background
+            # (_win_focused is the main-thread snapshot; this runs on
+            # the fetch worker)
+            self._poll_interval_ms = 1000 if self._win_focused else 2000
+        else:
+            self._poll_interval_ms = min(self._poll_interval_ms * 2, 30000)
 
     def _fetch_data(self):
-        """Fetch data from proxy"""
+        """Fetch data from proxy (worker thread; one in flight at a time)"""
         try:
-            with urllib.request.urlopen(f"{self.proxy_url}/__guardian__/stats", timeout=2) as resp:
-                stats = json.loads(resp.read())
-
-            with urllib.request.urlopen(f"{self.proxy_url}/__guardian__/activity", timeout=2) as resp:
-                activity = json.loads(resp.read())
+            self._do_fetch()
+        finally:
+            self._fetch_inflight = False
+
+    def _do_fetch(self):
+        # Once the proxy is known-down, probe with a 100 ms TCP connect
+        # before the real GET so a dead proxy costs microseconds instead
+        # of holding a worker for the full HTTP timeout
+        if self._consec_failures:
+            try:
+                socket.create_connection(("127.0.0.1", 6660), timeout=0.1).close()
+            except OSError:
+                self._consec_failures += 1
+                self._adapt_interval(False)
+                GLib.idle_add(self._update_ui, self._prepare_ui_state({}, [], False))
+                return
 
-            GLib.idle_add(self._update_ui, stats, activity.get("activity", []), True)
+        try:
+            # One combined request instead of separate stats + activity GETs
+            resp = _http_get(
+                f"{self.proxy_url}/__guardian__/dashboard",
+                headers={"If-None-Match": self._etag} if self._etag else None,
+            )
+            if resp.status == 304:
+                # Nothing changed: skip the body, the parse and the UI pass
+                self._consec_failures = 0
+                self._adapt_interval(False)
+                return
+            if resp.status == 200:
+                self._etag = resp.headers.get("ETag")
+                payload = _json.loads(resp.data)
+                stats = payload["stats"]
+                activity = payload.get("activity", [])
+            else:
+                # Older proxy without the combined endpoint
+                stats = _json.loads(
+                    _http_get(f"{self.proxy_url}/__guardian__/stats").data)
+                activity = _json.loads(
+                    _http_get(f"{self.proxy_url}/__guardian__/activity").data
+                ).get("activity", [])
+
+            # Hash the counters (not the raw body - uptime churns every
+            # second) to decide whether anything actually happened
+            payload_hash = hash((
+                stats.get("pii_items_protected"),
+                stats.get("requests_processed"),
+                activity[0].get("timestamp") if activity else None,
+            ))
+            changed = payload_hash != self._last_payload_hash
+            self._adapt_interval(changed)
+            self._last_payload_hash = payload_hash
+            self._consec_failures = 0
+
+            # Identical payload while the UI already shows "running":
+            # skip the main-loop dispatch entirely. Like the 304 path,
+            # uptime display only advances on real changes.
+            if changed or not self.proxy_running:
+                GLib.idle_add(self._update_ui,
+                              self._prepare_ui_state(stats, activity, True))
 
         except Exception:
-            GLib.idle_add(self._update_ui, {}, [], False)
+            self._consec_failures += 1
+            self._adapt_interval(False)
+            GLib.idle_add(self._update_ui, self._prepare_ui_state({}, [], False))
 
     def _refresh_data(self):
         """Manual refresh"""
-        threading.Thread(target=self._fetch_data, daemon=True).start()
+        if not self._fetch_inflight:
+            self._fetch_inflight = True
+            self._win_focused = self.is_active()
+            self.get_application().executor.submit(self._fetch_data)
 
-    def _update_ui(self, stats: dict, activity: list, proxy_running: bool):
-        """Update UI with new data"""
-        self.stats = stats
-        self.activity = activity
-        self.proxy_running = proxy_running
+    def _prepare_ui_state(self, stats: dict, activity: list, proxy_running: bool) -> dict:
+        """Pre-compute everything _update_ui needs.
 
-        # Sync protection toggle with flag file (in case changed externally)
-        current_flag = FLAG_FILE.exists()
-        if current_flag != self.protection_enabled:
-            self.protection_enabled = current_flag
-            self.protection_switch.set_active(current_flag)
-            if current_flag:
-                self.master_desc.set_text("Protection is ON - LLM traffic routed through proxy")
-            else:
-                self.master_desc.set_text("Protection is OFF - LLM traffic goes direct")
+        Runs on the fetch worker thread so the GTK main thread only does
+        widget writes - no string formatting or sorting.
+        """
+        return {
+            "stats": stats,
+            "activity": activity[:20],
+            "proxy_running": proxy_running,
+            "status": stats.get("status", "inactive").upper(),
+            "uptime": stats.get("uptime", "---"),
+            "protected": str(stats.get("pii_items_protected", 0)),
+            "requests": str(stats.get("requests_processed", 0)),
+            # Partial sort: only the displayed top entries need ordering,
+            # O(n log 50) instead of a full O(n log n) sort per tick
+            "by_type": heapq.nlargest(
+                50,
+                stats.get("vault", {}).get("by_type", {}).items(),
+                key=operator.itemgetter(1)
+            ),
+        }
+
+    def _update_ui(self, prepared: dict):
+        """Update UI with new data (pure widget writes).
+
+        The writes are wrapped in freeze_notify so the ~10 property
+        changes coalesce into one notify/layout pass instead of firing
+        individual signals per set_text.
+        """
+        self.freeze_notify()
+        try:
+            self._write_ui(prepared)
+        finally:
+            self.thaw_notify()
+
+    def _write_ui(self, prepared: dict):
+        self.stats = prepared["stats"]
+        self.activity = prepared["activity"]
+        self.proxy_running = proxy_running = prepared["proxy_running"]
+
+        # Flag state is kept current by the directory monitor
+        current_flag = self.protection_enabled
 
         # Update status banner
         if proxy_running and current_flag:
@@ -541,116 +1235,127 @@ class DashboardWindow(Adw.ApplicationWindow):
             self.status_banner.set_title("Protection disabled - Toggle switch to enable")
 
         # Update stat cards
-        status = stats.get("status", "inactive").upper()
-        self.status_card.value_label.set_text(status)
-        self.uptime_card.value_label.set_text(stats.get("uptime", "---"))
-        self.protected_card.value_label.set_text(str(stats.get("pii_items_protected", 0)))
-        self.requests_card.value_label.set_text(str(stats.get("requests_processed", 0)))
+        self.status_card.value_label.set_text(prepared["status"])
+        self.uptime_card.value_label.set_text(prepared["uptime"])
+        self.protected_card.value_label.set_text(prepared["protected"])
+        self.requests_card.value_label.set_text(prepared["requests"])
 
         # Update activity list
-        self._update_activity_list(activity)
+        self._update_activity_list(prepared["activity"])
 
         # Update type breakdown
-        self._update_type_list(stats.get("vault", {}).get("by_type", {}))
+        self._update_type_list(prepared["by_type"])
 
     def _update_activity_list(self, activity: list):
-        """Update the activity list"""
-        while True:
-            row = self.activity_list.get_row_at_index(0)
-            if row:
-                self.activity_list.remove(row)
-            else:
-                break
-
-        for item in activity[:20]:
-            row = self._create_activity_row(item)
-            self.activity_list.append(row)
-
-        if not activity:
-            placeholder = Gtk.Label(label="No activity yet - send a message to any LLM to see protection in action")
-            placeholder.set_opacity(0.5)
-            placeholder.set_margin_top(16)
-            placeholder.set_margin_bottom(16)
-            self.activity_list.append(placeholder)
-
-    def _create_activity_row(self, item: dict) -> Gtk.ListBoxRow:
-        """Create an activity list row"""
-        row = Gtk.ListBoxRow()
-        row.add_css_class("activity-row")
+        """Update the activity model: prepend new events, else one splice"""
+        items = activity[:20]
+        keys = [
+            (i.get("timestamp"), i.get("pii_type"), i.get("masked_value"))
+            for i in items
+        ]
+        h = hash(tuple(keys))
+        if h == self._last_activity_hash:
+            return
+        self._last_activity_hash = h
 
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_start(8)
-        box.set_margin_end(8)
-        box.set_margin_top(4)
-        box.set_margin_bottom(4)
-        row.set_child(box)
-
-        pii_type = item.get("pii_type", "UNKNOWN")
-        type_label = Gtk.Label(label=pii_type[:10])
-        type_label.add_css_class("pii-type")
-        type_label.set_width_chars(10)
-        box.append(type_label)
+        if not items:
+            self._activity_store.remove_all()
+            self._activity_keys = []
+            self._activity_frame.set_child(self._activity_placeholder)
+            return
 
-        masked = item.get("masked_value", "***")
-        masked_label = Gtk.Label(label=masked)
-        masked_label.set_hexpand(True)
-        masked_label.set_halign(Gtk.Align.START)
-        box.append(masked_label)
+        if self._activity_frame.get_child() is not self.activity_list:
+            self._activity_frame.set_child(self.activity_list)
+
+        # Steady state is "a few new events on top, the rest shifted
+        # down": when the previous contents survive as a suffix, insert
+        # only the new rows and drop the overflow instead of rebuilding
+        # all 20 items
+        old = self._activity_keys
+        self._activity_keys = keys
+        if old and old[0] in keys:
+            k = keys.index(old[0])
+            if k > 0 and keys[k:] == old[:len(keys) - k]:
+                self._activity_store.splice(
+                    0, 0, [ActivityItem(item) for item in items[:k]])
+                overflow = self._activity_store.get_n_items() - 20
+                if overflow > 0:
+                    self._activity_store.splice(20, overflow, [])
+                return
+
+        self._activity_store.splice(
+            0, self._activity_store.get_n_items(),
+            [ActivityItem(item) for item in items])
+
+    def _setup_activity_row(self, factory, list_item):
+        """Build an empty activity row from the XML template"""
+        builder = Gtk.Builder.new_from_string(_ACTIVITY_ROW_UI, -1)
+        row = builder.get_object("row")
+        row.type_label = builder.get_object("type_label")
+        row.masked_label = builder.get_object("masked_label")
+        row.provider_label = builder.get_object("provider_label")
+        row.time_label = builder.get_object("time_label")
+        list_item.set_child(row)
+
+    def _bind_activity_row(self, factory, list_item):
+        """Write one activity item into a recycled row"""
+        row = list_item.get_child()
+        item = list_item.get_item()
+        row.type_label.set_text(item.type_text)
+        row.masked_label.set_text(item.masked_text)
+        row.provider_label.set_text(item.provider_text)
+        row.provider_label.set_visible(bool(item.provider_text))
+        row.time_label.set_text(item.time_text)
+        row.time_label.set_visible(bool(item.time_text))
+
+    def _update_type_list(self, entries: list):
+        """Replace the type-breakdown model contents.
+
+        Takes (pii_type, count) pairs already sorted by the worker thread.
+        """
+        h = hash(tuple(entries))
+        if h == self._last_type_hash:
+            return
+        self._last_type_hash = h
 
-        provider = item.get("provider", "")
-        if provider:
-            provider_label = Gtk.Label(label=f"→ {provider}")
-            provider_label.add_css_class("provider")
-            box.append(provider_label)
+        if not entries:
+            self._type_store.remove_all()
+            self._type_frame.set_child(self._type_placeholder)
+            return
 
-        timestamp = item.get("timestamp", "")
-        if timestamp:
-            try:
-                dt = datetime.fromisoformat(timestamp)
-                time_str = dt.strftime("%H:%M:%S")
-            except:
-                time_str = timestamp[:8]
-            time_label = Gtk.Label(label=time_str)
-            time_label.add_css_class("timestamp")
-            box.append(time_label)
-
-        return row
-
-    def _update_type_list(self, by_type: dict):
-        """Update the type breakdown list"""
-        while True:
-            row = self.type_list.get_row_at_index(0)
-            if row:
-                self.type_list.remove(row)
-            else:
-                break
+        if self._type_frame.get_child() is not self.type_list:
+            self._type_frame.set_child(self.type_list)
+        self._type_store.splice(
+            0, self._type_store.get_n_items(),
+            [TypeItem(pii_type, count) for pii_type, count in entries])
 
-        for pii_type, count in sorted(by_type.items(), key=lambda x: -x[1]):
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            row.set_child(box)
+    def _setup_type_row(self, factory, list_item):
+        """Build an empty type-breakdown row"""
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        box.set_margin_start(12)
+        box.set_margin_end(12)
+        box.set_margin_top(8)
+        box.set_margin_bottom(8)
 
-            type_label = Gtk.Label(label=pii_type)
-            type_label.set_hexpand(True)
-            type_label.set_halign(Gtk.Align.START)
-            box.append(type_label)
+        type_label = Gtk.Label()
+        type_label.set_hexpand(True)
+        type_label.set_halign(Gtk.Align.START)
+        box.append(type_label)
 
-            count_label = Gtk.Label(label=str(count))
-            count_label.add_css_class("accent")
-            box.append(count_label)
+        count_label = Gtk.Label()
+        count_label.add_css_class("accent")
+        box.append(count_label)
 
-            self.type_list.append(row)
+        box.type_label = type_label
+        box.count_label = count_label
+        list_item.set_child(box)
 
-        if not by_type:
-            placeholder = Gtk.Label(label="No data yet")
-            placeholder.set_opacity(0.5)
-            placeholder.set_margin_top(16)
-            placeholder.set_margin_bottom(16)
-            self.type_list.append(placeholder)
+    def _bind_type_row(self, factory, list_item):
+        """Write one (type, count) entry into a recycled row"""
+        box = list_item.get_child()
+        item = list_item.get_item()
+        box.type_label.set_text(item.type_text)
+        box.count_label.set_text(item.count_text)
 
 
 class SetupDialog(Adw.Window):
@@ -659,8 +1364,13 @@ class SetupDialog(Adw.Window):
     def __init__(self, parent):
         super().__init__()
         self.parent_window = parent
-        self.wizard = SetupWizard()
+        self.wizard = _WIZARD
         self.app_checkboxes = {}
+        # Reusable dialogs, keyed by heading; building an
+        # Adw.MessageDialog tree per error is wasted layout work
+        self._error_dialogs = {}
+        self._instructions_dialog = None
+        self._instructions_label = None
 
         self.set_title("PrivacyGuardian Setup")
         self.set_default_size(500, 550)
@@ -714,7 +1424,7 @@ class SetupDialog(Adw.Window):
         welcome_box.append(welcome_desc)
 
         # Current status
-        status = self.wizard.get_current_config_status()
+        status = _get_config_status()
 
         status_frame = Gtk.Frame()
         status_frame.add_css_class("card")
@@ -809,6 +1519,7 @@ class SetupDialog(Adw.Window):
 
         # Run the setup
         result = self.wizard.install_aliases(selected_apps)
+        _invalidate_config_status()
 
         if result.success:
             self._show_success(result)
@@ -818,6 +1529,7 @@ class SetupDialog(Adw.Window):
     def _on_remove_clicked(self, button):
         """Handle remove button click"""
         result = self.wizard.remove_aliases()
+        _invalidate_config_status()
 
         if result.success:
             dialog = Adw.MessageDialog(
@@ -894,104 +1606,113 @@ class SetupDialog(Adw.Window):
         """Handle response from failure dialog"""
         if response == "copy" and result.manual_instructions:
             # Copy to clipboard
-            clipboard = Gdk.Display.get_default().get_clipboard()
-            clipboard.set(result.manual_instructions)
-
-            # Show the instructions in a new dialog
-            text_dialog = Adw.MessageDialog(
-                transient_for=self,
-                heading="Manual Setup Instructions",
-                body="Instructions copied to clipboard!\n\n"
-                     "Here they are for reference:"
-            )
-
-            # Add a scrolled text view for the instructions
-            scroll = Gtk.ScrolledWindow()
-            scroll.set_min_content_height(300)
-            scroll.set_min_content_width(400)
-
-            text_view = Gtk.TextView()
-            text_view.set_editable(False)
-            text_view.set_wrap_mode(Gtk.WrapMode.WORD)
-            text_view.set_monospace(True)
-            text_view.get_buffer().set_text(result.manual_instructions)
-            text_view.set_margin_start(8)
-            text_view.set_margin_end(8)
-            text_view.set_margin_top(8)
-            text_view.set_margin_bottom(8)
-
-            scroll.set_child(text_view)
-            text_dialog.set_extra_child(scroll)
+            _get_clipboard().set(result.manual_instructions)
+
+            # Build the instructions dialog once; later failures just
+            # swap the label text and re-present it
+            if self._instructions_dialog is None:
+                text_dialog = Adw.MessageDialog(
+                    transient_for=self,
+                    heading="Manual Setup Instructions",
+                    body="Instructions copied to clipboard!\n\n"
+                         "Here they are for reference:"
+                )
 
-            text_dialog.add_response("ok", "OK")
-            text_dialog.present()
+                # Add a scrolled text view for the instructions
+                scroll = Gtk.ScrolledWindow()
+                scroll.set_min_content_height(300)
+                scroll.set_min_content_width(400)
+
+                # Read-only text: a wrapping label is far lighter than a
+                # TextView, which drags in a full editable buffer, undo
+                # stack and input-method machinery we never use
+                text_label = Gtk.Label(label=result.manual_instructions)
+                text_label.set_selectable(True)
+                text_label.set_wrap(True)
+                text_label.set_xalign(0)
+                text_label.set_valign(Gtk.Align.START)
+                text_label.add_css_class("monospace")
+                text_label.set_margin_start(8)
+                text_label.set_margin_end(8)
+                text_label.set_margin_top(8)
+                text_label.set_margin_bottom(8)
+
+                scroll.set_child(text_label)
+                text_dialog.set_extra_child(scroll)
+
+                text_dialog.add_response("ok", "OK")
+                text_dialog.set_hide_on_close(True)
+                self._instructions_dialog = text_dialog
+                self._instructions_label = text_label
+
+            self._instructions_label.set_label(result.manual_instructions)
+            self._instructions_dialog.present()
 
     def _show_error(self, title, message):
         """Show a simple error dialog"""
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=title,
-            body=message
-        )
-        dialog.add_response("ok", "OK")
+        dialog = self._error_dialogs.get(title)
+        if dialog is None:
+            dialog = Adw.MessageDialog(
+                transient_for=self,
+                heading=title
+            )
+            dialog.add_response("ok", "OK")
+            # Responses hide instead of destroying, so the same dialog
+            # can be presented again with a fresh body
+            dialog.set_hide_on_close(True)
+            self._error_dialogs[title] = dialog
+        dialog.set_body(message)
         dialog.present()
 
     def _spawn_reload_terminal(self, config_file: str):
         """Open terminal with shell reload command ready - user just presses Enter"""
-        shell = os.environ.get('SHELL', '/bin/bash')
-        Path(config_file).name
-
-        if 'zsh' in shell:
+        if 'zsh' in _SHELL:
             reload_cmd = 'source ~/.zshrc'
-        elif 'fish' in shell:
+        elif 'fish' in _SHELL:
             reload_cmd = 'source ~/.config/fish/config.fish'
         else:
             reload_cmd = 'source ~/.bashrc'
 
         # Script to show in terminal
-        script = f'''
-echo ""
-echo "╔════════════════════════════════════════════════════════════════╗"
-echo "║         PrivacyGuardian Setup - One Last Step!                 ║"
-echo "╠════════════════════════════════════════════════════════════════╣"
-echo "║                                                                ║"
-echo "║  Press ENTER to reload your shell configuration.              ║"
-echo "║  This is the only manual step required!                        ║"
-echo "║                                                                ║"
-echo "║  After this, you can use 'claude' with protection enabled.    ║"
-echo "║                                                                ║"
-echo "╚════════════════════════════════════════════════════════════════╝"
-echo ""
-echo "Command: {reload_cmd}"
-echo ""
-read -p ">>> Press ENTER to continue... "
-{reload_cmd}
-echo ""
-echo "Done! You can now use this terminal with protection enabled."
-echo "Try: claude --help"
-echo ""
-exec {shell}
-'''
-
-        # Try different terminal emulators in order of preference
-        terminals = [
-            ['gnome-terminal', '--', 'bash', '-c', script],
-            ['konsole', '-e', 'bash', '-c', script],
-            ['xfce4-terminal', '-x', 'bash', '-c', script],
-            ['mate-terminal', '-x', 'bash', '-c', script],
-            ['tilix', '-e', 'bash', '-c', script],
-            ['xterm', '-e', 'bash', '-c', script],
-        ]
+        script = _RELOAD_TPL.substitute(reload_cmd=reload_cmd, shell=_SHELL)
 
-        for term_cmd in terminals:
-            try:
-                subprocess.Popen(term_cmd, start_new_session=True)
-                return True
-            except FileNotFoundError:
-                continue
+        term_cmd = _find_terminal()
+        if term_cmd is None:
+            return False
 
-        # No terminal found - return False
-        return False
+        try:
+            # posix_spawnp uses vfork-style clone under glibc, so the
+            # GTK process's address space is never copied (fork would
+            # duplicate the page tables of the whole dashboard)
+            os.posix_spawnp(term_cmd[0], term_cmd + [script], os.environ,
+                            setsid=True)
+            return True
+        except OSError:
+            return False
+
+
+def _mask_value(value):
+    """Mask a value for display"""
+    if not value or len(value) < 4:
+        return "****"
+    return value[:2] + "*" * min(len(value) - 4, 20) + value[-2:]
+
+
+class TokenItem(GObject.Object):
+    """One decrypted vault entry backing a row in the vault viewer"""
+
+    def __init__(self, token_id, pii_type, decrypted, created_at):
+        super().__init__()
+        self.token_id = token_id
+        self.pii_type = pii_type
+        self.decrypted = decrypted
+        self.created_at = created_at
+        # Lowered once here so the filter predicate is a plain substring
+        # scan with no per-item allocations per keystroke
+        self.search_key = f"{pii_type.lower()}\n{token_id.lower()}"
+        # Masked once here: rows re-bind on every scroll/recycle, and
+        # the masked form of an immutable value never changes
+        self.masked = _mask_value(decrypted)
 
 
 class VaultViewerDialog(Adw.Window):
@@ -1001,6 +1722,25 @@ class VaultViewerDialog(Adw.Window):
         super().__init__()
         self.parent_window = parent
         self.token_data = []  # List of (token_id, pii_type, decrypted_value, created_at)
+        self._search_text = ""
+
+        # Decrypt cache: token contents are immutable once written, so a
+        # token_id decrypts to the same value forever and refreshes only
+        # pay crypto for rows they have not seen. Kept strictly in
+        # memory - persisting plaintext next to the vault would defeat
+        # the encryption.
+        self._decrypt_cache = {}
+        self._vault_mtime = None
+        self._pending_tokens = None  # staged data awaiting one idle flush
+        self._search_timer = 0
+        self._load_gen = 0  # bumped per fetch so stale batches are dropped
+
+        # One read-only vault connection for the dialog's lifetime;
+        # SQLite's page cache stays warm across refresh clicks. Fetches
+        # run on background threads, so access is serialized by a lock.
+        self._conn = None
+        self._db_lock = threading.Lock()
+        self.connect("close-request", self._on_close_request)
 
         self.set_title("Access Vault")
         self.set_default_size(700, 600)
@@ -1062,14 +1802,45 @@ class VaultViewerDialog(Adw.Window):
         # Scrollable list
         scroll = Gtk.ScrolledWindow()
         scroll.set_vexpand(True)
-        main_box.append(scroll)
 
-        self.vault_list = Gtk.ListBox()
-        self.vault_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.vault_list.add_css_class("boxed-list")
+        # Model-backed list: refresh is one splice, search is a C-side
+        # refilter - no manual row remove/append loops
+        self._store = Gio.ListStore.new(TokenItem)
+        self._filter = Gtk.CustomFilter.new(self._matches_search)
+        self._filter_model = Gtk.FilterListModel.new(self._store, self._filter)
+
+        # ListView only realizes the rows in (and just around) the
+        # viewport and recycles their widgets while scrolling, so a
+        # 10,000-token vault costs the same widget count as a 20-token
+        # one. ListBox would build every row up front.
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._setup_vault_row)
+        factory.connect("bind", self._bind_vault_row)
+
+        self.vault_list = Gtk.ListView.new(
+            Gtk.NoSelection.new(self._filter_model), factory)
+        self.vault_list.add_css_class("rich-list")
         self.vault_list.set_margin_start(16)
         self.vault_list.set_margin_end(16)
         self.vault_list.set_margin_bottom(16)
+
+        # ListView has no built-in placeholder; overlay a label that is
+        # shown whenever the filtered model is empty
+        self._placeholder = Gtk.Label(label="Loading...")
+        self._placeholder.set_opacity(0.5)
+        self._placeholder.set_halign(Gtk.Align.CENTER)
+        self._placeholder.set_valign(Gtk.Align.CENTER)
+
+        overlay = Gtk.Overlay()
+        overlay.set_child(scroll)
+        overlay.add_overlay(self._placeholder)
+        main_box.append(overlay)
+
+        self._filter_model.connect(
+            "items-changed",
+            lambda model, *_: self._placeholder.set_visible(
+                model.get_n_items() == 0))
+
         scroll.set_child(self.vault_list)
 
         # Status bar
@@ -1080,229 +1851,358 @@ class VaultViewerDialog(Adw.Window):
 
     def _load_vault_data(self):
         """Load and decrypt all tokens from the vault"""
-        threading.Thread(target=self._fetch_vault_data, daemon=True).start()
+        # Reuse the application's worker pool rather than paying a
+        # thread spawn per refresh click
+        self.parent_window.get_application().executor.submit(
+            self._fetch_vault_data)
 
     def _fetch_vault_data(self):
         """Fetch vault data in background thread"""
         import sqlite3
 
         vault_path = Path.home() / ".privacyguardian" / "vault.db"
+        self._load_gen += 1
+        gen = self._load_gen
         if not vault_path.exists():
             GLib.idle_add(self._show_empty_state, "No vault found")
             return
 
+        # Untouched vault since the last load: reuse the data as-is
+        mtime = vault_path.stat().st_mtime
+        if mtime == self._vault_mtime and self.token_data:
+            GLib.idle_add(self._update_vault_list, self.token_data)
+            return
+
         try:
-            # Import crypto
-            sys.path.insert(0, str(CODE_DIR))
-            from crypto_native import CryptoNative
-            crypto = CryptoNative()
-
-            conn = sqlite3.connect(str(vault_path))
-            cursor = conn.execute(
-                "SELECT token_id, pii_type, encrypted_value, created_at FROM tokens ORDER BY created_at DESC"
-            )
+            crypto = _get_crypto()
+
+            with self._db_lock:
+                if self._conn is None:
+                    # Read-only open: no journal/lock bookkeeping, and
+                    # the viewer can never block or corrupt the proxy's
+                    # writes. mmap lets SQLite page the table straight
+                    # from the OS cache.
+                    self._conn = sqlite3.connect(
+                        f"file:{vault_path}?mode=ro", uri=True,
+                        check_same_thread=False)
+                    self._conn.execute("PRAGMA mmap_size=67108864")
+                    self._conn.execute("PRAGMA query_only=1")
+                cursor = self._conn.execute(
+                    "SELECT token_id, pii_type, encrypted_value, created_at FROM tokens ORDER BY created_at DESC"
+                )
+                cursor.arraysize = 1000
+                fetched = cursor.fetchall()
+
+            # Normalize bytes -> str once so the decrypt loop is branch-free
+            rows = [
+                (tid, ptype,
+                 enc.decode('utf-8') if isinstance(enc, bytes) else enc,
+                 created)
+                for tid, ptype, enc, created in fetched
+            ]
+
+            # Nested token references are resolved against this dict:
+            # one SELECT for the whole vault instead of one round-trip
+            # per nesting level per row
+            enc_by_id = {tid: enc for tid, _, enc, _ in rows}
+
+            cache = self._decrypt_cache
+
+            def decrypt_row(entry):
+                tid, ptype, enc, created = entry
+                decrypted = cache.get(tid)
+                if decrypted is None:
+                    try:
+                        decrypted = self._decrypt_recursive(crypto, enc_by_id, enc)
+                    except Exception:
+                        decrypted = "[Decryption failed]"
+                    if not decrypted.startswith("[Decryption"):
+                        cache[tid] = decrypted
+                return (tid, ptype, decrypted, created)
+
+            # libpgcrypto is called through ctypes.CDLL, which releases
+            # the GIL per call, so rows decrypt in parallel across cores.
+            # Tiny vaults skip the pool setup cost.
+            if len(rows) > 64:
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=os.cpu_count()) as pool:
+                    token_data = self._stream_decrypted(
+                        gen, pool.map(decrypt_row, rows, chunksize=8))
+            else:
+                token_data = self._stream_decrypted(
+                    gen, map(decrypt_row, rows))
 
-            token_data = []
-            for row in cursor.fetchall():
-                token_id, pii_type, encrypted_value, created_at = row
+            self._vault_mtime = mtime
+            GLib.idle_add(self._finish_vault_load, gen, token_data)
 
-                # Decrypt - handle nested tokens
-                try:
-                    encrypted_str = encrypted_value.decode('utf-8') if isinstance(encrypted_value, bytes) else encrypted_value
-                    decrypted = self._decrypt_recursive(crypto, conn, encrypted_str)
-                except Exception:
-                    decrypted = "[Decryption failed]"
+        except Exception as e:
+            GLib.idle_add(self._show_empty_state, f"Error: {e}")
 
-                token_data.append((token_id, pii_type, decrypted, created_at))
+    def _stream_decrypted(self, gen, results, batch_size=32):
+        """Drain a decrypt iterator, posting rows to the UI in batches.
 
-            conn.close()
-            GLib.idle_add(self._update_vault_list, token_data)
+        The first batch reaches the window as soon as 32 rows are ready,
+        so large vaults show data while the rest is still decrypting
+        instead of after one monolithic splice at the end.
+        """
+        token_data = []
+        batch = []
+        first = True
+        for entry in results:
+            token_data.append(entry)
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                GLib.idle_add(self._append_vault_batch, gen, batch, first)
+                batch = []
+                first = False
+        if batch or first:
+            GLib.idle_add(self._append_vault_batch, gen, batch, first)
+        return token_data
+
+    def _append_vault_batch(self, gen, batch, first):
+        """Append one decrypted batch to the list model (main thread)"""
+        if gen != self._load_gen:
+            return False  # a newer load superseded this one
+        if first:
+            self._placeholder.set_text("No items in vault")
+            self._store.remove_all()
+        if batch:
+            items = [TokenItem(*entry) for entry in batch]
+            self._store.splice(self._store.get_n_items(), 0, items)
+        return False
 
-        except Exception as e:
-            GLib.idle_add(self._show_empty_state, f"Error: {e}")
+    def _finish_vault_load(self, gen, token_data):
+        """Record the completed load and settle the status line"""
+        if gen != self._load_gen:
+            return False
+        self.token_data = token_data
+        self.status_label.set_text(f"{len(token_data)} items in vault")
+        return False
 
-    def _decrypt_recursive(self, crypto, conn, encrypted_token, depth=0):
-        """Decrypt a token, following nested tokens up to 5 levels deep"""
-        if depth > 5:
-            return "[Max depth reached]"
+    def _decrypt_recursive(self, crypto, enc_by_id, encrypted_token):
+        """Decrypt a token, following nested tokens up to 5 levels deep.
 
+        A flat loop rather than recursion: nested chains cost one frame
+        and one try/except total instead of one of each per level.
+        """
         try:
-            result = crypto.decrypt_value_only(encrypted_token)
-            if not result:
-                return "[Decryption failed]"
-
-            # Check if result is another token
-            if result.startswith("◈PG:") and result.endswith("◈"):
-                # Look up this token in the database
-                cursor = conn.execute(
-                    "SELECT encrypted_value FROM tokens WHERE token_id = ?", (result,)
-                )
-                row = cursor.fetchone()
-                if row:
-                    nested_encrypted = row[0].decode('utf-8') if isinstance(row[0], bytes) else row[0]
-                    return self._decrypt_recursive(crypto, conn, nested_encrypted, depth + 1)
-                else:
+            for _ in range(6):
+                result = crypto.decrypt_value_only(encrypted_token)
+                if not result:
+                    return "[Decryption failed]"
+
+                # Check if result is another token
+                if not (result.startswith("◈PG:") and result.endswith("◈")):
+                    return result
+                nested_encrypted = enc_by_id.get(result)
+                if nested_encrypted is None:
                     return result  # Token not in vault, return as-is
-
-            return result
+                encrypted_token = nested_encrypted
+            return "[Max depth reached]"
         except Exception:
             return "[Decryption error]"
 
     def _update_vault_list(self, token_data):
-        """Update the vault list with decrypted data"""
+        """Stage new vault data for display.
+
+        Back-to-back updates (refresh spam, overlapping loads) overwrite
+        the staged payload and flush once, so only the latest state ever
+        pays for a model splice.
+        """
+        first = self._pending_tokens is None
+        self._pending_tokens = token_data
+        if first:
+            GLib.idle_add(self._flush_vault_update)
+
+    def _flush_vault_update(self):
+        """Apply the most recently staged vault data (one model splice)"""
+        token_data, self._pending_tokens = self._pending_tokens, None
         self.token_data = token_data
+        self._placeholder.set_text("No items in vault")
 
-        # Clear existing rows
-        while True:
-            row = self.vault_list.get_row_at_index(0)
-            if row:
-                self.vault_list.remove(row)
-            else:
-                break
+        items = [TokenItem(*entry) for entry in token_data]
 
-        for token_id, pii_type, decrypted, created_at in token_data:
-            row = self._create_vault_row(token_id, pii_type, decrypted, created_at)
-            self.vault_list.append(row)
+        # One splice; the ListView only re-binds the handful of rows
+        # actually in the viewport regardless of the store size
+        self._store.splice(0, self._store.get_n_items(), items)
 
         self.status_label.set_text(f"{len(token_data)} items in vault")
-
-    def _create_vault_row(self, token_id, pii_type, decrypted, created_at):
-        """Create a row for a vault item"""
-        row = Gtk.ListBoxRow()
-
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        main_box.set_margin_start(12)
-        main_box.set_margin_end(12)
-        main_box.set_margin_top(8)
-        main_box.set_margin_bottom(8)
-        row.set_child(main_box)
-
-        # Top row: type badge and token ID
-        top_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        main_box.append(top_row)
+        return False  # one-shot idle callback
+
+    def _matches_search(self, item) -> bool:
+        """Filter predicate for the vault list model"""
+        return not self._search_text or self._search_text in item.search_key
+
+    def _setup_vault_row(self, factory, list_item):
+        """Build one reusable row widget (ListView factory, no data yet)"""
+        # One Grid instead of nested Boxes: GtkBox re-measures children
+        # while distributing space, so flattening the hierarchy cuts the
+        # measure() calls per row on resize/scroll
+        grid = Gtk.Grid()
+        grid.set_column_spacing(8)
+        grid.set_row_spacing(4)
+        grid.set_margin_start(12)
+        grid.set_margin_end(12)
+        grid.set_margin_top(8)
+        grid.set_margin_bottom(8)
 
         # Type badge
-        type_label = Gtk.Label(label=pii_type)
+        type_label = Gtk.Label()
         type_label.add_css_class("pii-type")
         type_label.set_width_chars(12)
         type_label.set_xalign(0)
-        top_row.append(type_label)
-
-        # Token ID (truncated)
-        short_id = token_id[4:20] + "..." if len(token_id) > 20 else token_id
-        id_label = Gtk.Label(label=short_id)
-        id_label.add_css_class("dim-label")
-        id_label.set_hexpand(True)
-        id_label.set_xalign(0)
-        top_row.append(id_label)
+        grid.attach(type_label, 0, 0, 1, 1)
+
+        # Display-only text goes through Gtk.Inscription: unlike
+        # Gtk.Label it has a pre-known size and skips the repeated Pango
+        # layout measurement per measure() pass
+        id_insc = Gtk.Inscription()
+        id_insc.add_css_class("dim-label")
+        id_insc.set_hexpand(True)
+        id_insc.set_min_chars(8)
+        grid.attach(id_insc, 1, 0, 2, 1)
+
+        time_insc = Gtk.Inscription()
+        time_insc.add_css_class("timestamp")
+        time_insc.set_min_chars(16)
+        grid.attach(time_insc, 3, 0, 1, 1)
+
+        # Value (masked by default); the selectable Gtk.Label is only
+        # built if the user actually reveals the value
+        value_insc = Gtk.Inscription()
+        value_insc.set_hexpand(True)
+        value_insc.set_min_chars(8)
+        value_insc.add_css_class("monospace")
+        grid.attach(value_insc, 0, 1, 2, 1)
 
-        # Timestamp
-        try:
-            dt = datetime.fromisoformat(created_at)
-            time_str = dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            time_str = created_at[:16] if created_at else ""
-        time_label = Gtk.Label(label=time_str)
-        time_label.add_css_class("timestamp")
-        top_row.append(time_label)
-
-        # Bottom row: masked value + reveal/copy buttons
-        bottom_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        main_box.append(bottom_row)
-
-        # Value label (masked by default)
-        masked_value = self._mask_value(decrypted)
-        value_label = Gtk.Label(label=masked_value)
-        value_label.set_hexpand(True)
-        value_label.set_xalign(0)
-        value_label.set_selectable(True)
-        value_label.add_css_class("monospace")
-        bottom_row.append(value_label)
-
-        # Store the real value
-        row.real_value = decrypted
-        row.value_label = value_label
-        row.is_revealed = False
-
-        # Reveal button
         reveal_btn = Gtk.Button(label="Reveal")
         reveal_btn.set_tooltip_text("Show the actual value")
-        reveal_btn.connect("clicked", lambda b: self._toggle_reveal(row, b))
-        bottom_row.append(reveal_btn)
-        row.reveal_btn = reveal_btn
+        reveal_btn.connect("clicked", lambda b, g=grid: self._toggle_reveal(g, b))
+        grid.attach(reveal_btn, 2, 1, 1, 1)
 
-        # Copy button
         copy_btn = Gtk.Button(icon_name="edit-copy-symbolic")
         copy_btn.set_tooltip_text("Copy to clipboard")
-        copy_btn.connect("clicked", lambda b: self._copy_value(decrypted))
-        bottom_row.append(copy_btn)
-
-        return row
+        copy_btn.connect("clicked",
+                         lambda b, g=grid: self._copy_value(g.real_value))
+        grid.attach(copy_btn, 3, 1, 1, 1)
+
+        grid.type_label = type_label
+        grid.id_insc = id_insc
+        grid.time_insc = time_insc
+        grid.value_insc = value_insc
+        grid.reveal_btn = reveal_btn
+        grid.value_label = None  # created on first reveal
+        grid.is_revealed = False
+        grid.real_value = ""
+        list_item.set_child(grid)
+
+    def _bind_vault_row(self, factory, list_item):
+        """Fill a recycled row widget with one item's data"""
+        grid = list_item.get_child()
+        item = list_item.get_item()
+        token_id = item.token_id
+        created_at = item.created_at
+
+        grid.type_label.set_label(item.pii_type)
 
-    def _mask_value(self, value):
-        """Mask a value for display"""
-        if not value or len(value) < 4:
-            return "****"
-        return value[:2] + "*" * min(len(value) - 4, 20) + value[-2:]
+        short_id = token_id[4:20] + "..." if len(token_id) > 20 else token_id
+        grid.id_insc.set_text(short_id)
 
-    def _toggle_reveal(self, row, button):
-        """Toggle between masked and revealed value"""
-        if row.is_revealed:
-            row.value_label.set_text(self._mask_value(row.real_value))
+        try:
+            dt = datetime.fromisoformat(created_at)
+            time_str = dt.strftime("%Y-%m-%d %H:%M")
+        except:
+            time_str = created_at[:16] if created_at else ""
+        grid.time_insc.set_text(time_str)
+
+        grid.real_value = item.decrypted
+        grid.value_insc.set_text(item.masked)
+
+        # A recycled widget may arrive still revealed from its previous
+        # item; never carry a revealed value across rows
+        if grid.is_revealed:
+            grid.remove(grid.value_label)
+            grid.attach(grid.value_insc, 0, 1, 2, 1)
+            grid.reveal_btn.set_label("Reveal")
+            grid.is_revealed = False
+
+    def _toggle_reveal(self, grid, button):
+        """Toggle between masked and revealed value by swapping widgets"""
+        if grid.is_revealed:
+            grid.remove(grid.value_label)
+            grid.attach(grid.value_insc, 0, 1, 2, 1)
             button.set_label("Reveal")
-            row.is_revealed = False
+            grid.is_revealed = False
         else:
-            row.value_label.set_text(row.real_value)
+            if grid.value_label is None:
+                label = Gtk.Label()
+                label.set_hexpand(True)
+                label.set_xalign(0)
+                label.set_selectable(True)
+                label.add_css_class("monospace")
+                grid.value_label = label
+            # Set on every reveal: the widget is recycled across items
+            grid.value_label.set_label(grid.real_value)
+            grid.remove(grid.value_insc)
+            grid.attach(grid.value_label, 0, 1, 2, 1)
             button.set_label("Hide")
-            row.is_revealed = True
+            grid.is_revealed = True
 
     def _copy_value(self, value):
         """Copy value to clipboard"""
-        clipboard = Gdk.Display.get_default().get_clipboard()
-        clipboard.set(value)
+        _get_clipboard().set(value)
         self.status_label.set_text("Copied to clipboard!")
         GLib.timeout_add(2000, lambda: self.status_label.set_text(f"{len(self.token_data)} items in vault"))
 
     def _on_search_changed(self, entry):
-        """Filter the list based on search text"""
-        search_text = entry.get_text().lower()
-
-        # Clear and re-populate with filtered results
-        while True:
-            row = self.vault_list.get_row_at_index(0)
-            if row:
-                self.vault_list.remove(row)
-            else:
-                break
+        """Debounce keystrokes; rapid typing filters once, at the end"""
+        if self._search_timer:
+            GLib.source_remove(self._search_timer)
+        self._search_timer = GLib.timeout_add(120, self._apply_search,
+                                              entry.get_text())
 
-        filtered_count = 0
-        for token_id, pii_type, decrypted, created_at in self.token_data:
-            if search_text in pii_type.lower() or search_text in token_id.lower():
-                row = self._create_vault_row(token_id, pii_type, decrypted, created_at)
-                self.vault_list.append(row)
-                filtered_count += 1
+    def _apply_search(self, text):
+        """Filter the list based on search text"""
+        self._search_timer = 0
+        key = text.lower()
+        old = self._search_text
+        if key == old:
+            return False  # unchanged; nothing to refilter
+        self._search_text = key
+
+        # Typing extends the previous key -> the match set can only
+        # shrink, so GTK only re-tests currently visible items (and the
+        # reverse for backspacing); anything else is a full refilter
+        if old and key.startswith(old):
+            change = Gtk.FilterChange.MORE_STRICT
+        elif key and old.startswith(key):
+            change = Gtk.FilterChange.LESS_STRICT
+        else:
+            change = Gtk.FilterChange.DIFFERENT
+        self._filter.changed(change)
 
-        if search_text:
-            self.status_label.set_text(f"Showing {filtered_count} of {len(self.token_data)} items")
+        if self._search_text:
+            self.status_label.set_text(
+                f"Showing {self._filter_model.get_n_items()} of {len(self.token_data)} items")
         else:
             self.status_label.set_text(f"{len(self.token_data)} items in vault")
+        return False  # one-shot debounce timer
 
     def _show_empty_state(self, message):
         """Show empty state message"""
-        while True:
-            row = self.vault_list.get_row_at_index(0)
-            if row:
-                self.vault_list.remove(row)
-            else:
-                break
-
-        placeholder = Gtk.Label(label=message)
-        placeholder.set_opacity(0.5)
-        placeholder.set_margin_top(32)
-        placeholder.set_margin_bottom(32)
-        self.vault_list.append(placeholder)
+        self.token_data = []
+        self._store.remove_all()
+        self._placeholder.set_text(message)
         self.status_label.set_text("")
 
+    def _on_close_request(self, *_args):
+        """Release the cached vault connection when the dialog closes"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        return False  # let the window close normally
+
 
 def main():
     """Run the dashboard application"""
@@ -145,26 +145,20 @@ WantedBy=default.target
     def _enable_service(self) -> Tuple[bool, str]:
         """Enable and start the systemd service"""
         # Reload daemon
-        result = subprocess.run(
+        subprocess.run(
             ["systemctl", "--user", "daemon-reload"],
             capture_output=True, text=True
         )
 
-        # Enable service
+        # enable --now enables and starts in a single invocation
         result = subprocess.run(
-            ["systemctl", "--user", "enable", "privacyguardian"],
+            ["systemctl", "--user", "enable", "--now", "privacyguardian"],
             capture_output=True, text=True
         )
 
         if result.returncode != 0:
             return False, result.stderr
 
-        # Start service
-        result = subprocess.run(
-            ["systemctl", "--user", "start", "privacyguardian"],
-            capture_output=True, text=True
-        )
-
         # Enable lingering so service runs even when logged out
         subprocess.run(
             ["loginctl", "enable-linger", self.user],
@@ -202,17 +196,21 @@ X-GNOME-Autostart-enabled=true
 
     def status(self) -> dict:
         """Get installation status"""
+        # One `systemctl show` call reports both properties, halving the
+        # subprocess forks compared to is-active + is-enabled
         result = subprocess.run(
-            ["systemctl", "--user", "is-active", "privacyguardian"],
+            ["systemctl", "--user", "show", "privacyguardian",
+             "--property=ActiveState", "--property=UnitFileState",
+             "--no-pager"],
             capture_output=True, text=True
         )
-        service_active = result.stdout.strip() == "active"
-
-        result = subprocess.run(
-            ["systemctl", "--user", "is-enabled", "privacyguardian"],
-            capture_output=True, text=True
+        props = dict(
+            line.split("=", 1)
+            for line in result.stdout.splitlines()
+            if "=" in line
         )
-        service_enabled = result.stdout.strip() == "enabled"
+        service_active = props.get("ActiveState") == "active"
+        service_enabled = props.get("UnitFileState") == "enabled"
 
         return {
             "service_installed": self.service_file.exists(),
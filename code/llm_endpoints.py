@@ -4,8 +4,10 @@ PrivacyGuardian - LLM Endpoints Registry
 Configuration for all supported LLM API providers.
 """
 
+import functools
+
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 
 @dataclass
@@ -17,17 +19,17 @@ class LLMProvider:
     api_key_headers: List[str]  # Headers containing API keys to protect
     content_type: str = "application/json"
 
+    def __post_init__(self):
+        # Wildcard and plain patterns both match their base domain and
+        # any subdomain of it, so the patterns collapse into one exact
+        # set plus one suffix tuple, parsed once instead of per call
+        bases = [d[2:] if d.startswith("*.") else d for d in self.domains]
+        self._exact_domains = frozenset(bases)
+        self._suffixes = tuple("." + base for base in bases)
+
     def matches_domain(self, domain: str) -> bool:
         """Check if a domain matches this provider"""
-        for pattern in self.domains:
-            if pattern.startswith("*."):
-                # Wildcard match
-                suffix = pattern[1:]  # .openai.azure.com
-                if domain.endswith(suffix) or domain == pattern[2:]:
-                    return True
-            elif domain == pattern or domain.endswith("." + pattern):
-                return True
-        return False
+        return domain in self._exact_domains or domain.endswith(self._suffixes)
 
 
 # All supported LLM providers
@@ -156,38 +158,84 @@ LLM_PROVIDERS: Dict[str, LLMProvider] = {
 }
 
 
-def get_provider_for_domain(domain: str) -> Optional[LLMProvider]:
-    """Find the LLM provider for a given domain"""
-    # Remove port if present for matching
-    domain_no_port = domain.split(":")[0] if ":" in domain else domain
+# Provider leaf marker inside the trie; domain labels can never contain
+# a NUL byte, so the key cannot collide with real data
+_LEAF = "\x00provider"
 
-    for provider in LLM_PROVIDERS.values():
-        if provider.matches_domain(domain) or provider.matches_domain(domain_no_port):
-            return provider
-    return None
 
+def _build_domain_trie() -> dict:
+    """Build a reverse-label suffix trie over all provider domains.
 
-def get_all_domains() -> List[str]:
-    """Get list of all LLM API domains to intercept"""
-    domains = []
+    Every pattern (wildcard or not) matches the bare domain and any
+    subdomain of it, so one trie walk from the TLD side replaces the
+    per-request scan over every provider and every pattern.
+    """
+    trie: dict = {}
     for provider in LLM_PROVIDERS.values():
-        domains.extend(provider.domains)
-    return domains
+        for pattern in provider.domains:
+            key = pattern[2:] if pattern.startswith("*.") else pattern
+            node = trie
+            for label in reversed(key.lower().split(".")):
+                node = node.setdefault(label, {})
+            node.setdefault(_LEAF, provider)
+    return trie
+
+
+_DOMAIN_TRIE = _build_domain_trie()
+
+
+def _trie_lookup(domain: str) -> Optional[LLMProvider]:
+    """Walk the trie; the deepest leaf passed is the most specific match"""
+    node = _DOMAIN_TRIE
+    found = None
+    for label in reversed(domain.split(".")):
+        node = node.get(label)
+        if node is None:
+            break
+        found = node.get(_LEAF, found)
+    return found
+
 
+@functools.lru_cache(maxsize=4096)
+def get_provider_for_domain(domain: str) -> Optional[LLMProvider]:
+    """Find the LLM provider for a given domain.
+
+    Runs on every intercepted request, so repeated hosts resolve from
+    the lru_cache and cold hosts cost one trie walk per label.
+    """
+    provider = _trie_lookup(domain.lower())
+    if provider is None and ":" in domain:
+        # Retry without the port for patterns that don't carry one
+        provider = _trie_lookup(domain.split(":")[0].lower())
+    return provider
+
+
+# The registry is fixed at import time, so both domain views can be
+# computed once instead of rebuilt on every call
+_ALL_DOMAINS: Tuple[str, ...] = tuple(
+    domain
+    for provider in LLM_PROVIDERS.values()
+    for domain in provider.domains
+)
+
+# dict.fromkeys dedups while preserving first-seen order
+_DOMAINS_FOR_IPTABLES: Tuple[str, ...] = tuple(dict.fromkeys(
+    domain.split(":")[0]
+    for provider in LLM_PROVIDERS.values()
+    for domain in provider.domains
+    if not (domain.startswith("*.") or domain.startswith("localhost")
+            or domain.startswith("127."))
+))
 
-def get_domains_for_iptables() -> List[str]:
+
+def get_all_domains() -> Tuple[str, ...]:
+    """Get all LLM API domains to intercept"""
+    return _ALL_DOMAINS
+
+
+def get_domains_for_iptables() -> Tuple[str, ...]:
     """Get domains suitable for iptables rules (no wildcards, no ports)"""
-    domains = []
-    for provider in LLM_PROVIDERS.values():
-        for domain in provider.domains:
-            # Skip wildcards and localhost
-            if domain.startswith("*.") or domain.startswith("localhost") or domain.startswith("127."):
-                continue
-            # Remove port
-            domain_clean = domain.split(":")[0]
-            if domain_clean not in domains:
-                domains.append(domain_clean)
-    return domains
+    return _DOMAINS_FOR_IPTABLES
 
 
 # Quick test
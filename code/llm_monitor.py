@@ -9,13 +9,75 @@ Can run on CPU with ~2GB RAM overhead.
 """
 
 import json
+import logging
+import re
+import string
 import threading
 import queue
+from collections import Counter, deque
+from logging.handlers import QueueHandler, QueueListener
+from itertools import islice
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
 
+from pii_detector import PII_PATTERNS
+
+
+# Queue sentinel that wakes the monitor loop immediately on stop()
+_SHUTDOWN = object()
+
+
+def _get_logger() -> logging.Logger:
+    """Get the monitor logger, wiring its queue writer on first use.
+
+    Detection records go through a QueueHandler, so the monitor thread
+    only enqueues; a QueueListener daemon thread does the actual file
+    writes, keeping write() syscalls off the analysis path.
+    """
+    logger = logging.getLogger("pg.monitor")
+    if not logger.handlers:
+        log_queue: queue.Queue = queue.Queue()
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(logging.INFO)
+
+        log_dir = Path.home() / ".privacyguardian"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        writer = logging.FileHandler(log_dir / "monitor.log")
+        writer.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+        )
+        listener = QueueListener(log_queue, writer)
+        listener.start()  # daemon thread; dies with the process
+        logger._pg_listener = listener  # keep a reference alive
+    return logger
+
+# Ordinary ASCII bytes deleted by the density gate below; whatever
+# survives the translate is "unusual" content worth a closer look
+_SAFE_BYTES = bytes(
+    string.ascii_letters + string.digits + string.whitespace + string.punctuation,
+    "ascii"
+)
+
+
+def _build_pii_prefilter() -> Optional[re.Pattern]:
+    """Join every PII pattern into one alternation for a cheap pre-scan.
+
+    A single regex pass over a sample is orders of magnitude cheaper than
+    an LLM inference; if nothing fires, the model never needs to run.
+    Patterns compiled with IGNORECASE keep that behavior via a scoped
+    inline flag so the rest of the alternation stays case-sensitive.
+    """
+    parts = []
+    for compiled in PII_PATTERNS.values():
+        prefix = "(?i:" if compiled.flags & re.IGNORECASE else "(?:"
+        parts.append(prefix + compiled.pattern + ")")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None  # fall back to always running the model
+
 
 @dataclass
 class MonitorResult:
@@ -53,10 +115,13 @@ Respond in JSON format:
     def __init__(self, model_path: Optional[str] = None):
         self.model = None
         self.model_path = model_path or self._find_model()
+        self._prefilter = _build_pii_prefilter()
         self.monitor_queue = queue.Queue(maxsize=100)
-        self.results: List[MonitorResult] = []
+        # deque drops the oldest result automatically at 100 entries
+        self.results: deque = deque(maxlen=100)
         self.running = False
         self._thread = None
+        self._logger = _get_logger()
 
     def _find_model(self) -> Optional[str]:
         """Find a suitable tiny model"""
@@ -132,6 +197,31 @@ Respond in JSON format:
                 action="passed" if has_tokens else "warned"
             )
 
+        # Cheap regex pre-scan: if no PII pattern fires anywhere in the
+        # sample, skip the model inference entirely
+        if self._prefilter is not None:
+            if not self._prefilter.search(sample):
+                return MonitorResult(
+                    timestamp=timestamp,
+                    text_sample=sample[:100],
+                    detected_pii=[],
+                    confidence=0.9,
+                    action="passed"
+                )
+        else:
+            # Fallback gate when the combined regex failed to compile:
+            # delete every ordinary ASCII byte in one C-level translate
+            # pass and skip inference if almost nothing unusual remains
+            suspicious = sample.encode("utf-8", "ignore").translate(None, _SAFE_BYTES)
+            if len(suspicious) < 4:
+                return MonitorResult(
+                    timestamp=timestamp,
+                    text_sample=sample[:100],
+                    detected_pii=[],
+                    confidence=0.7,
+                    action="passed"
+                )
+
         try:
             prompt = f"{self.SYSTEM_PROMPT}\n\nText to analyze:\n{sample}\n\nJSON response:"
 
@@ -192,28 +282,53 @@ Respond in JSON format:
         except queue.Full:
             pass  # Drop if queue is full
 
+    # How many queued samples to process per wakeup
+    BATCH_SIZE = 8
+
     def _monitor_loop(self):
         """Background monitoring thread"""
+        last_hash = None
         while self.running:
             try:
-                text = self.monitor_queue.get(timeout=1.0)
-                result = self.analyze(text)
-                self.results.append(result)
-
-                # Keep last 100 results
-                if len(self.results) > 100:
-                    self.results = self.results[-100:]
-
-                # Log warnings/blocks
-                if result.action == "blocked":
-                    print(f"\n⚠️  BLOCKED: Potential PII detected: {result.detected_pii}")
-                elif result.action == "warned":
-                    print(f"\n⚡ WARNING: Possible PII: {result.detected_pii}")
-
+                batch = [self.monitor_queue.get(timeout=1.0)]
             except queue.Empty:
                 continue
-            except Exception as e:
-                print(f"Monitor error: {e}")
+
+            # Drain whatever else queued up so a burst of requests is
+            # handled in one wakeup instead of a get() round-trip each
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self.monitor_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for text in batch:
+                if text is _SHUTDOWN:
+                    return
+
+                # Skip identical consecutive samples (retried prompts)
+                text_hash = hash(text)
+                if text_hash == last_hash:
+                    continue
+                last_hash = text_hash
+
+                try:
+                    result = self.analyze(text)
+                    self.results.append(result)
+
+                    # Log warnings/blocks (handed off to the queue
+                    # listener's writer thread, never written inline)
+                    if result.action == "blocked":
+                        self._logger.warning(
+                            "BLOCKED: potential PII detected: %s", result.detected_pii
+                        )
+                    elif result.action == "warned":
+                        self._logger.warning(
+                            "possible PII: %s", result.detected_pii
+                        )
+
+                except Exception as e:
+                    self._logger.error("monitor error: %s", e)
 
     def start(self):
         """Start background monitoring"""
@@ -228,25 +343,31 @@ Respond in JSON format:
     def stop(self):
         """Stop background monitoring"""
         self.running = False
+        try:
+            # Wake the loop's blocking get() right away instead of
+            # letting it run out its 1s timeout
+            self.monitor_queue.put_nowait(_SHUTDOWN)
+        except queue.Full:
+            pass  # loop notices running=False after its timeout
         if self._thread:
             self._thread.join(timeout=2.0)
         print("LLM Monitor stopped")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get monitoring statistics"""
-        total = len(self.results)
-        blocked = sum(1 for r in self.results if r.action == "blocked")
-        warned = sum(1 for r in self.results if r.action == "warned")
-        passed = sum(1 for r in self.results if r.action == "passed")
+        actions = Counter(r.action for r in self.results)
+
+        # Last 10 results, oldest first, without copying the whole deque
+        last_ten = reversed(list(islice(reversed(self.results), 10)))
 
         return {
-            "total_analyzed": total,
-            "blocked": blocked,
-            "warned": warned,
-            "passed": passed,
+            "total_analyzed": len(self.results),
+            "blocked": actions["blocked"],
+            "warned": actions["warned"],
+            "passed": actions["passed"],
             "recent_detections": [
                 {"pii": r.detected_pii, "action": r.action}
-                for r in self.results[-10:]
+                for r in last_ten
                 if r.detected_pii
             ]
         }
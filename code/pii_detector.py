@@ -8,6 +8,12 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from enum import Enum
 
+# Optional: Intel Hyperscan for a single SIMD pass over all patterns
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 
 class PIIType(Enum):
     # === PERSONAL IDENTIFIERS ===
@@ -321,11 +327,85 @@ class PIIDetector:
         if custom_patterns:
             self.patterns.update(custom_patterns)
 
+        # When hyperscan is available, one streaming-safe DFA pass decides
+        # which of the Python regexes can possibly match, so most text is
+        # scanned exactly once. The Python patterns still produce the
+        # final spans because they carry the capture groups.
+        self._hs_db = None
+        self._hs_types: List[PIIType] = []
+        self._hs_unfiltered: set = set()
+        if hyperscan is not None:
+            self._build_prefilter()
+
+    def _build_prefilter(self):
+        """Compile all compatible patterns into one Hyperscan prefilter DB"""
+        expressions = []
+        flags = []
+        types = []
+        unfiltered = set()
+
+        for pii_type, pattern in self.patterns.items():
+            expr = pattern.pattern.encode('utf-8')
+            expr_flags = (hyperscan.HS_FLAG_PREFILTER |
+                          hyperscan.HS_FLAG_SINGLEMATCH |
+                          hyperscan.HS_FLAG_UTF8)
+            if pattern.flags & re.IGNORECASE:
+                expr_flags |= hyperscan.HS_FLAG_CASELESS
+            if pattern.flags & re.MULTILINE:
+                expr_flags |= hyperscan.HS_FLAG_MULTILINE
+
+            # Probe each pattern individually; unsupported constructs
+            # (lookarounds etc.) stay on the pure-regex path
+            try:
+                probe = hyperscan.Database()
+                probe.compile(expressions=[expr], ids=[0], flags=[expr_flags])
+            except hyperscan.error:
+                unfiltered.add(pii_type)
+                continue
+
+            expressions.append(expr)
+            flags.append(expr_flags)
+            types.append(pii_type)
+
+        if expressions:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    flags=flags,
+                )
+                self._hs_db = db
+                self._hs_types = types
+                self._hs_unfiltered = unfiltered
+            except hyperscan.error:
+                self._hs_db = None
+
+    def _prefilter(self, text: str) -> Optional[set]:
+        """Return the PII types that can possibly match, or None to run all"""
+        if self._hs_db is None:
+            return None
+
+        hits = set()
+
+        def on_match(match_id, start, end, flags, context):
+            hits.add(self._hs_types[match_id])
+
+        try:
+            self._hs_db.scan(text.encode('utf-8'), match_event_handler=on_match)
+        except hyperscan.error:
+            return None
+
+        return hits | self._hs_unfiltered
+
     def detect(self, text: str) -> List[PIIMatch]:
         """Detect all PII in text, returns list of matches"""
         matches = []
+        candidates = self._prefilter(text)
 
         for pii_type, pattern in self.patterns.items():
+            if candidates is not None and pii_type not in candidates:
+                continue
             for match in pattern.finditer(text):
                 # Handle groups vs full match
                 if match.groups():
@@ -5,8 +5,9 @@ Parses and modifies LLM API requests/responses for different providers.
 Extracts message content from various JSON structures.
 """
 
-import json
 import re
+
+import orjson
 from typing import Any, List, Tuple, Callable
 from llm_endpoints import LLMProvider
 
@@ -32,8 +33,8 @@ class RequestParser:
         Returns: (modified_body, pii_count)
         """
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
             # Not JSON, protect as plain text
             protected = self.protect(body.decode('utf-8', errors='replace'))
             return protected.encode('utf-8'), 0
@@ -42,21 +43,21 @@ class RequestParser:
         modified, count = self._protect_json_recursive(data, provider.message_paths)
         pii_count += count
 
-        return json.dumps(modified).encode('utf-8'), pii_count
+        return orjson.dumps(modified), pii_count
 
     def unprotect_response(self, body: bytes, provider: LLMProvider) -> bytes:
         """
         Unprotect (decrypt) tokens in an incoming response.
         """
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
             # Not JSON, unprotect as plain text
             unprotected = self.unprotect(body.decode('utf-8', errors='replace'))
             return unprotected.encode('utf-8')
 
         modified = self._unprotect_json_recursive(data)
-        return json.dumps(modified).encode('utf-8')
+        return orjson.dumps(modified)
 
     def _protect_json_recursive(self, data: Any, message_paths: List[str], current_path: str = "") -> Tuple[Any, int]:
         """
@@ -145,36 +146,47 @@ class StreamingParser:
 
     def __init__(self, unprotector: Callable[[str], str]):
         self.unprotect = unprotector
-        self.buffer = ""
+        self.buffer = b""
 
     def process_chunk(self, chunk: bytes) -> bytes:
-        """Process a streaming chunk, unprotecting any tokens"""
-        try:
-            text = chunk.decode('utf-8')
-        except UnicodeDecodeError:
+        """Process a streaming chunk, unprotecting any tokens.
+
+        Works on bytes throughout: only the `data:` payloads that might
+        hold tokens are parsed, the rest of the chunk is passed through
+        as unmodified byte slices.
+        """
+        # Fast path: no ◈ sentinel means no tokens. Serializers that
+        # escape non-ASCII ship the sentinel as the literal \\u25c8
+        # escape rather than its raw UTF-8 bytes (e2 97 88), so check
+        # both spellings before bailing. Each test is a memchr-style scan in C, so token-free
+        # chunks (the common case) still skip all parsing.
+        if (b'\xe2\x97\x88' not in chunk
+                and b'\\u25c8' not in chunk
+                and b'\\u25C8' not in chunk):
             return chunk
 
         # Handle SSE format: data: {...}\n\n
-        lines = text.split('\n')
+        lines = chunk.split(b'\n')
         result_lines = []
 
         for line in lines:
-            if line.startswith('data: '):
+            if line.startswith(b'data: '):
                 data_part = line[6:]
-                if data_part.strip() == '[DONE]':
+                if data_part.strip() == b'[DONE]':
                     result_lines.append(line)
                 else:
                     try:
-                        json_data = json.loads(data_part)
+                        json_data = orjson.loads(data_part)
                         unprotected = self._unprotect_recursive(json_data)
-                        result_lines.append(f"data: {json.dumps(unprotected)}")
-                    except json.JSONDecodeError:
+                        result_lines.append(b'data: ' + orjson.dumps(unprotected))
+                    except orjson.JSONDecodeError:
                         # Not JSON, unprotect as text
-                        result_lines.append(f"data: {self.unprotect(data_part)}")
+                        text = data_part.decode('utf-8', errors='replace')
+                        result_lines.append(b'data: ' + self.unprotect(text).encode('utf-8'))
             else:
                 result_lines.append(line)
 
-        return '\n'.join(result_lines).encode('utf-8')
+        return b'\n'.join(result_lines)
 
     def _unprotect_recursive(self, data: Any) -> Any:
         """Recursively unprotect all strings"""
@@ -225,11 +237,11 @@ if __name__ == "__main__":
     }
 
     protected, count = parser.protect_request(
-        json.dumps(anthropic_request).encode(),
+        orjson.dumps(anthropic_request),
         LLM_PROVIDERS["anthropic"]
     )
     print(f"Original: {anthropic_request}")
-    print(f"Protected: {json.loads(protected)}")
+    print(f"Protected: {orjson.loads(protected)}")
     print(f"PII count: {count}")
 
     # Test OpenAI-style request
@@ -243,9 +255,9 @@ if __name__ == "__main__":
     }
 
     protected, count = parser.protect_request(
-        json.dumps(openai_request).encode(),
+        orjson.dumps(openai_request),
         LLM_PROVIDERS["openai"]
     )
     print(f"Original: {openai_request}")
-    print(f"Protected: {json.loads(protected)}")
+    print(f"Protected: {orjson.loads(protected)}")
     print(f"PII count: {count}")
@@ -127,6 +127,33 @@ def test_round_trip():
     assert restored == original, f"Round-trip failed.\nOriginal: {original}\nRestored: {restored}"
 
 
+# =============================================================================
+# TEST 6: Streaming Unprotection of ASCII-Escaped Chunks
+# =============================================================================
+# WHY: Some upstreams serialize JSON with ensure_ascii, so the token sentinel
+#      ◈ arrives as the escape \\u25c8 with no raw UTF-8 bytes in the chunk.
+#      If the streaming fast path misses that form, tokens leak to the user.
+
+def test_streaming_unprotect_escaped_chunk():
+    """Verify escaped SSE chunks still get their tokens restored"""
+    import json
+    from request_parser import StreamingParser
+
+    token = "◈PG:EMAIL_0123456789ab◈"
+    parser = StreamingParser(lambda text: text.replace(token, "john@x.com"))
+
+    # ensure_ascii escapes the sentinel: no raw e2 97 88 bytes remain
+    payload = json.dumps({"delta": f"hi {token}"}, ensure_ascii=True)
+    assert "\\u25c8" in payload
+    result = parser.process_chunk(f"data: {payload}\n\n".encode("ascii"))
+    assert b"hi john@x.com" in result, f"Escaped chunk not unprotected: {result}"
+
+    # The raw (unescaped) form keeps working too
+    payload = json.dumps({"delta": f"hi {token}"}, ensure_ascii=False)
+    result = parser.process_chunk(f"data: {payload}\n\n".encode("utf-8"))
+    assert b"hi john@x.com" in result
+
+
 # =============================================================================
 # Run with: pytest tests/test_basic.py -v
 # =============================================================================